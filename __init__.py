@@ -13,14 +13,38 @@ from . import group_input
 from . import frame
 from . import attribute
 from . import node_utils
+from . import tree_cache
+from . import finder
+from . import usage
+from . import hashing
+from . import critical_path
+from . import lint
+from . import bake
+from . import const_fold
 
 def register():
     group_input.register()
     frame.register()
     attribute.register()
     node_utils.register()
+    tree_cache.register()
+    finder.register()
+    usage.register()
+    hashing.register()
+    critical_path.register()
+    lint.register()
+    bake.register()
+    const_fold.register()
 
 def unregister():
+    const_fold.unregister()
+    bake.unregister()
+    lint.unregister()
+    critical_path.unregister()
+    hashing.unregister()
+    usage.unregister()
+    finder.unregister()
+    tree_cache.unregister()
     attribute.unregister()
     frame.unregister()
     group_input.unregister()
@@ -1,16 +1,117 @@
 import bpy
-from bpy.types import Operator, PropertyGroup, Panel
-from bpy.props import StringProperty, CollectionProperty, IntProperty, BoolProperty
-
-class FoundAttribute(PropertyGroup):
-    node_path: StringProperty(name="Node Path")
-    node_name: StringProperty(name="Node Name")
-    hierarchy_level: IntProperty(name="Hierarchy Level")
+import sys
+from array import array
+from bpy.app.handlers import persistent
+from bpy.types import Operator, Panel
+from bpy.props import StringProperty, IntProperty, BoolProperty
+from .batch import batch_updates, tag_tree_update, tag_redraw
+
+# Rows drawn per page of the Found Attributes list
+RESULTS_PER_PAGE = 20
+
+NAMED_ATTRIBUTE_NODES = ['GeometryNodeInputNamedAttribute', 'GeometryNodeStoreNamedAttribute', 'GeometryNodeRemoveNamedAttribute']
+
+def get_attribute_name(node):
+    if node.bl_idname == 'GeometryNodeInputNamedAttribute':
+        return node.inputs[0].default_value
+    elif node.bl_idname == 'GeometryNodeStoreNamedAttribute':
+        name_socket = next((input for input in node.inputs if input.name == 'Name'), None)
+        return name_socket.default_value if name_socket else node.name
+    elif node.bl_idname == 'GeometryNodeRemoveNamedAttribute':
+        return node.inputs[1].default_value
+    return node.name
+
+def iter_named_attributes(node_tree, search_name, path=None, hierarchy_level=0, found_nodes=None):
+    # Yields (path, node, attribute_name, hierarchy_level) for every matching named attribute node, descending into groups
+    path = path or []
+    found_nodes = found_nodes if found_nodes is not None else set()
+    for node in node_tree.nodes:
+        if node.type == 'GROUP' and node.node_tree:
+            current_path = path + [f"{node.node_tree.name} (Group)"]
+            yield from iter_named_attributes(node.node_tree, search_name, current_path, hierarchy_level + 1, found_nodes)
+        else:
+            current_path = path + [node.name]
+
+        if node.bl_idname in NAMED_ATTRIBUTE_NODES:
+            attribute_name = get_attribute_name(node)
+            if search_name in attribute_name.lower():
+                if node not in found_nodes:
+                    found_nodes.add(node)
+                    yield current_path, node, attribute_name, hierarchy_level
+
+class AttributeResultStore:
+    # Search hits kept outside of Blender data: no .blend bloat, no undo steps.
+    # Paths are stored as ids into a table of interned segments, record i spans
+    # _segment_refs[_path_starts[i]:_path_starts[i + 1]].
+    __slots__ = ("_segments", "_segment_ids", "_segment_refs", "_path_starts", "_sorted", "page")
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self._segments = []
+        self._segment_ids = {}
+        self._segment_refs = array('I')
+        self._path_starts = array('I', [0])
+        self._sorted = None
+        self.page = 0
+
+    def __len__(self):
+        return len(self._path_starts) - 1
+
+    def _segment_id(self, segment):
+        segment_id = self._segment_ids.get(segment)
+        if segment_id is None:
+            segment_id = len(self._segments)
+            self._segments.append(sys.intern(segment))
+            self._segment_ids[segment] = segment_id
+        return segment_id
+
+    def add(self, path):
+        self._segment_refs.extend(self._segment_id(segment) for segment in path)
+        self._path_starts.append(len(self._segment_refs))
+        self._sorted = None
+
+    def path(self, index):
+        refs = self._segment_refs[self._path_starts[index]:self._path_starts[index + 1]]
+        return [self._segments[ref] for ref in refs]
+
+    def sorted_indices(self):
+        # Paths sorted component-wise with nodes before groups at each level, computed once per search
+        if self._sorted is None:
+            def sort_key(index):
+                return tuple((part.split(' (Group)')[0], 'zzzz' if '(Group)' in part else part) for part in self.path(index))
+            self._sorted = sorted(range(len(self)), key=sort_key)
+        return self._sorted
+
+    @property
+    def page_count(self):
+        return max(1, -(-len(self) // RESULTS_PER_PAGE))
+
+    def page_indices(self):
+        # Only the visible window of results is ever turned into UI rows
+        self.page = min(max(self.page, 0), self.page_count - 1)
+        start = self.page * RESULTS_PER_PAGE
+        return self.sorted_indices()[start:start + RESULTS_PER_PAGE]
+
+# One store per window for this session
+_result_stores = {}
+
+def get_result_store(context):
+    key = context.window.as_pointer() if context.window else 0
+    store = _result_stores.get(key)
+    if store is None:
+        store = _result_stores[key] = AttributeResultStore()
+    return store
+
+@persistent
+def _clear_result_stores(*args):
+    _result_stores.clear()
 
 class NODEHELPER_OT_find_named_attributes(Operator):
     bl_idname = "nodehelper.find_named_attributes"
     bl_label = "Find Named Attributes"
-    bl_options = {'REGISTER', 'UNDO'}
+    bl_options = {'REGISTER'}
 
     def execute(self, context):
         if context.area.type != 'NODE_EDITOR':
@@ -23,45 +124,25 @@ class NODEHELPER_OT_find_named_attributes(Operator):
 
         search_name = context.scene.attribute_search_name.lower()
         
-        context.scene.found_attributes.clear()
+        self.store = get_result_store(context)
+        self.store.clear()
         
         found_nodes = set()
 
         self.search_node_tree(context.space_data.edit_tree, search_name, [], found_nodes)
 
-        self.report({'INFO'}, f"Found {len(context.scene.found_attributes)} unique attribute node(s).")
+        self.report({'INFO'}, f"Found {len(self.store)} unique attribute node(s).")
         return {'FINISHED'}
 
     def search_node_tree(self, node_tree, search_name, path, found_nodes, hierarchy_level=0):
-        for node in node_tree.nodes:
-            if node.type == 'GROUP' and node.node_tree:
-                current_path = path + [f"{node.node_tree.name} (Group)"]
-                self.search_node_tree(node.node_tree, search_name, current_path, found_nodes, hierarchy_level + 1)
-            else:
-                current_path = path + [node.name]
-            
-            if node.bl_idname in ['GeometryNodeInputNamedAttribute', 'GeometryNodeStoreNamedAttribute', 'GeometryNodeRemoveNamedAttribute']:
-                attribute_name = self.get_attribute_name(node)
-                if search_name in attribute_name.lower():
-                    if node not in found_nodes:
-                        self.add_found_attribute(node, current_path, attribute_name, hierarchy_level)
-                        found_nodes.add(node)
+        for current_path, node, attribute_name, level in iter_named_attributes(node_tree, search_name, path, hierarchy_level, found_nodes):
+            self.add_found_attribute(node, current_path, attribute_name, level)
 
     def get_attribute_name(self, node):
-        if node.bl_idname == 'GeometryNodeInputNamedAttribute':
-            return node.inputs[0].default_value
-        elif node.bl_idname == 'GeometryNodeStoreNamedAttribute':
-            name_socket = next((input for input in node.inputs if input.name == 'Name'), None)
-            return name_socket.default_value if name_socket else node.name
-        elif node.bl_idname == 'GeometryNodeRemoveNamedAttribute':
-            return node.inputs[1].default_value
-        return node.name
+        return get_attribute_name(node)
 
     def add_found_attribute(self, node, path, attribute_name, hierarchy_level):
-        item = bpy.context.scene.found_attributes.add()
-        item.node_path = ' > '.join(path)
-        item.node_name = f"{node.bl_label}: {attribute_name}"
-        item.hierarchy_level = hierarchy_level
+        self.store.add(path)
 
 class NODEHELPER_OT_jump_to_node(Operator):
     bl_idname = "nodehelper.jump_to_node"
@@ -71,8 +152,11 @@ class NODEHELPER_OT_jump_to_node(Operator):
     index: IntProperty()
 
     def execute(self, context):
-        item = context.scene.found_attributes[self.index]
-        path = item.node_path.split(' > ')
+        store = get_result_store(context)
+        if not 0 <= self.index < len(store):
+            self.report({'ERROR'}, "Search results are out of date, search again.")
+            return {'CANCELLED'}
+        path = store.path(self.index)
         target_node_name = path[-1]
 
         current_tree = context.space_data.node_tree
@@ -97,9 +181,7 @@ class NODEHELPER_OT_jump_to_node(Operator):
 
             if i == len(path) - 1:
                 bpy.ops.node.view_selected('INVOKE_DEFAULT')
-                for area in context.screen.areas:
-                    if area.type == 'NODE_EDITOR':
-                        area.tag_redraw()
+                tag_redraw(context)
                 self.report({'INFO'}, f"Jumped to node: {node.name}")
                 return {'FINISHED'}
             else:
@@ -113,6 +195,20 @@ class NODEHELPER_OT_jump_to_node(Operator):
         self.report({'ERROR'}, "Failed to navigate to the target node.")
         return {'CANCELLED'}
 
+class NODEHELPER_OT_attribute_results_page(Operator):
+    bl_idname = "nodehelper.attribute_results_page"
+    bl_label = "Change Results Page"
+    bl_description = "Show the previous or next page of found attributes"
+
+    delta: IntProperty(default=1)
+
+    def execute(self, context):
+        store = get_result_store(context)
+        store.page += self.delta
+        store.page_indices()
+        tag_redraw(context)
+        return {'FINISHED'}
+
 class NODEHELPER_OT_rename_attribute(Operator):
     bl_idname = "nodehelper.rename_attribute"
     bl_label = "Rename Attribute"
@@ -136,24 +232,28 @@ class NODEHELPER_OT_rename_attribute(Operator):
             self.report({'ERROR'}, "No active Geometry Nodes modifier found.")
             return {'CANCELLED'}
 
-        renamed_count = self.rename_attributes(active_modifier.node_group, old_name, new_name)
+        with batch_updates(context):
+            renamed_count = self.rename_attributes(active_modifier.node_group, old_name, new_name, set())
+            tag_redraw(context)
 
         self.report({'INFO'}, f"Renamed {renamed_count} attribute(s) from '{old_name}' to '{new_name}'.")
         
-        for area in bpy.context.screen.areas:
-            if area.type == 'NODE_EDITOR':
-                area.tag_redraw()
-        
         return {'FINISHED'}
 
-    def rename_attributes(self, node_group, old_name, new_name):
+    def rename_attributes(self, node_group, old_name, new_name, visited):
         renamed_count = 0
-        if node_group and node_group.type == 'GEOMETRY':
+        # Shared groups are renamed once, no matter how many group nodes instance them
+        if node_group and node_group.type == 'GEOMETRY' and node_group not in visited:
+            visited.add(node_group)
+            group_count = 0
             for node in node_group.nodes:
                 if node.type == 'GROUP':
-                    renamed_count += self.rename_attributes(node.node_tree, old_name, new_name)
+                    renamed_count += self.rename_attributes(node.node_tree, old_name, new_name, visited)
                 else:
-                    renamed_count += self.rename_attribute_node(node, old_name, new_name)
+                    group_count += self.rename_attribute_node(node, old_name, new_name)
+            if group_count:
+                tag_tree_update(node_group)
+            renamed_count += group_count
         return renamed_count
 
     def rename_attributes_in_group(self, node_tree, old_name, new_name):
@@ -218,48 +318,27 @@ class NODEHELPER_PT_attribute_panel(Panel):
         row.label(text="Found Attributes")
 
         if scene.show_attribute_list:
-            row = box.row()
-            col = row.column()
-            col.template_list("NODEHELPER_UL_AttributeList", "", scene, "found_attributes", scene, "active_attribute_index", rows=5)
-
-class NODEHELPER_UL_AttributeList(bpy.types.UIList):
-    def draw_item(self, context, layout, data, item, icon, active_data, active_propname):
-        if self.layout_type in {'DEFAULT', 'COMPACT'}:
-            row = layout.row(align=True)
-            
-            # Clean up the node path by removing " (Group)"
-            clean_path = ' > '.join([part.split(' (Group)')[0] for part in item.node_path.split(' > ')])
-            
-            op = row.operator("nodehelper.jump_to_node", text=clean_path, emboss=True)
-            op.index = data.found_attributes.values().index(item)
-            
-        elif self.layout_type in {'GRID'}:
-            layout.alignment = 'CENTER'
-            layout.label(text="", icon='NODE')
-
-    def filter_items(self, context, data, propname):
-        helpers = bpy.types.UI_UL_list
-        items = getattr(data, propname)
-
-        def parse_path(path):
-            components = path.split(' > ')
-            return tuple((comp.split(' (Group)')[0], 'zzzz' if '(Group)' in comp else comp) for comp in components)
-
-        sorted_items = sorted(enumerate(items), key=lambda x: parse_path(x[1].node_path))
-        order = [i[0] for i in sorted_items]
-
-        filter_flags = [self.bitflag_filter_item] * len(items)
-
-        return filter_flags, order
+            store = get_result_store(context)
+            col = box.column(align=True)
+            for index in store.page_indices():
+                # Clean up the node path by removing " (Group)"
+                clean_path = ' > '.join([part.split(' (Group)')[0] for part in store.path(index)])
+                op = col.operator("nodehelper.jump_to_node", text=clean_path, emboss=True)
+                op.index = index
+
+            if store.page_count > 1:
+                row = box.row(align=True)
+                row.operator("nodehelper.attribute_results_page", text="", icon='TRIA_LEFT').delta = -1
+                row.label(text=f"{store.page + 1} / {store.page_count} ({len(store)})")
+                row.operator("nodehelper.attribute_results_page", text="", icon='TRIA_RIGHT').delta = 1
 
 def register():
-    bpy.utils.register_class(FoundAttribute)
     bpy.utils.register_class(NODEHELPER_OT_find_named_attributes)
     bpy.utils.register_class(NODEHELPER_OT_jump_to_node)
+    bpy.utils.register_class(NODEHELPER_OT_attribute_results_page)
     bpy.utils.register_class(NODEHELPER_OT_rename_attribute)
     bpy.utils.register_class(NODEHELPER_PT_attribute_panel)
-    bpy.utils.register_class(NODEHELPER_UL_AttributeList)
-    bpy.types.Scene.found_attributes = CollectionProperty(type=FoundAttribute)
+    bpy.app.handlers.load_post.append(_clear_result_stores)
     bpy.types.Scene.attribute_search_name = StringProperty(
         name="Search Attribute",
         description="Enter the name of the attribute to search for",
@@ -269,23 +348,21 @@ def register():
         name="Show Attribute List",
         default=True
     )
-    bpy.types.Scene.active_attribute_index = IntProperty()
     bpy.types.Scene.old_attribute_name = StringProperty(name="Old Attribute Name")
     bpy.types.Scene.new_attribute_name = StringProperty(name="New Attribute Name")
 
 def unregister():
     del bpy.types.Scene.new_attribute_name
     del bpy.types.Scene.old_attribute_name
-    del bpy.types.Scene.active_attribute_index
     del bpy.types.Scene.show_attribute_list
     del bpy.types.Scene.attribute_search_name
-    del bpy.types.Scene.found_attributes
-    bpy.utils.unregister_class(NODEHELPER_UL_AttributeList)
+    bpy.app.handlers.load_post.remove(_clear_result_stores)
+    _result_stores.clear()
     bpy.utils.unregister_class(NODEHELPER_PT_attribute_panel)
     bpy.utils.unregister_class(NODEHELPER_OT_rename_attribute)
+    bpy.utils.unregister_class(NODEHELPER_OT_attribute_results_page)
     bpy.utils.unregister_class(NODEHELPER_OT_jump_to_node)
     bpy.utils.unregister_class(NODEHELPER_OT_find_named_attributes)
-    bpy.utils.unregister_class(FoundAttribute)
 
 if __name__ == "__main__":
     register()
\ No newline at end of file
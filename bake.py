@@ -0,0 +1,336 @@
+import bpy
+import json
+import os
+import queue
+import subprocess
+import threading
+from bpy.types import Operator, Panel, PropertyGroup, UIList
+from bpy.props import IntProperty, CollectionProperty
+from .hashing import modifier_digest
+from .cli import LINE_PREFIX, PYTHON_EXIT_CODE
+from .node_utils import sync_proxy_rows
+
+BAKE_STAMP = ".nodehelper_bake.json"
+
+class BakeTarget:
+    __slots__ = ("object_name", "modifier_name", "bake_id", "node_name", "kind", "path", "size", "status", "selected", "progress")
+
+    def __init__(self, object_name, modifier_name, bake_id, node_name, kind, path):
+        self.object_name = object_name
+        self.modifier_name = modifier_name
+        self.bake_id = bake_id
+        self.node_name = node_name
+        self.kind = kind
+        self.path = path
+        self.size = 0
+        self.status = 'MISSING'
+        self.selected = False
+        self.progress = ""
+
+    @property
+    def key(self):
+        return [self.object_name, self.modifier_name, self.bake_id]
+
+def bake_cache_path(modifier, bake):
+    if getattr(bake, "use_custom_path", False):
+        directory = bake.directory
+        return bpy.path.abspath(directory) if directory else None
+    if not modifier.bake_directory:
+        return None
+    return os.path.join(bpy.path.abspath(modifier.bake_directory), str(bake.bake_id))
+
+def cache_size(path):
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+def read_bake_stamp(path):
+    try:
+        with open(os.path.join(path, BAKE_STAMP)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def write_bake_stamp(path, digest):
+    with open(os.path.join(path, BAKE_STAMP), "w") as f:
+        json.dump({"digest": digest}, f)
+
+def bake_status(modifier, bake, path):
+    bake_target = getattr(bake, "bake_target", 'INHERIT')
+    # Packed bakes and NodesModifier.bake_target only exist from Blender 4.3
+    if bake_target == 'PACKED' or (bake_target == 'INHERIT' and getattr(modifier, "bake_target", 'DISK') == 'PACKED'):
+        return 'PACKED'
+    if not path or not os.path.isdir(path):
+        return 'MISSING'
+    stamp = read_bake_stamp(path)
+    if stamp is None:
+        return 'UNKNOWN'
+    # The stamp records the content hash of the modifier's node group and inputs at bake time
+    return 'OK' if stamp.get("digest") == modifier_digest(modifier) else 'STALE'
+
+def collect_bake_targets():
+    # Bake nodes and simulation zones of every Nodes modifier, nested groups included
+    targets = []
+    for obj in bpy.data.objects:
+        for modifier in obj.modifiers:
+            if modifier.type != 'NODES' or not modifier.node_group or not hasattr(modifier, "bakes"):
+                continue
+            for bake in modifier.bakes:
+                node = getattr(bake, "node", None)
+                kind = 'SIMULATION' if node and node.bl_idname == 'GeometryNodeSimulationOutput' else 'BAKE'
+                path = bake_cache_path(modifier, bake)
+                target = BakeTarget(obj.name, modifier.name, bake.bake_id, node.name if node else str(bake.bake_id), kind, path)
+                target.status = bake_status(modifier, bake, path)
+                if target.status not in {'MISSING', 'PACKED'}:
+                    target.size = cache_size(path)
+                targets.append(target)
+    return targets
+
+def format_size(size):
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+_bake_targets = []
+_bake_job = {'running': False, 'cancel': False, 'done': 0, 'total': 0}
+
+class BakeTargetRow(PropertyGroup):
+    pass
+
+def _relay_output(process, messages):
+    for line in process.stdout:
+        if line.startswith(LINE_PREFIX):
+            try:
+                messages.put(json.loads(line[len(LINE_PREFIX):]))
+            except ValueError:
+                pass
+
+class NODEHELPER_OT_refresh_bake_targets(Operator):
+    bl_idname = "nodehelper.refresh_bake_targets"
+    bl_label = "Refresh Bake Targets"
+    bl_description = "List every Bake node and simulation zone used by Nodes modifiers in the file"
+
+    def execute(self, context):
+        selected = {tuple(target.key) for target in _bake_targets if target.selected}
+        _bake_targets.clear()
+        _bake_targets.extend(collect_bake_targets())
+        sync_proxy_rows(context.window_manager.nodehelper_bake_rows, len(_bake_targets))
+        for target in _bake_targets:
+            target.selected = tuple(target.key) in selected
+        self.report({'INFO'}, f"Found {len(_bake_targets)} bake target(s)")
+        return {'FINISHED'}
+
+class NODEHELPER_OT_toggle_bake_target(Operator):
+    bl_idname = "nodehelper.toggle_bake_target"
+    bl_label = "Toggle Bake Target"
+    bl_description = "Include or exclude this target from the next bake"
+
+    index: IntProperty(default=-1)
+
+    def execute(self, context):
+        if self.index < 0:
+            # Select everything that is not up to date
+            for target in _bake_targets:
+                target.selected = target.status in {'MISSING', 'STALE', 'UNKNOWN'}
+        elif self.index < len(_bake_targets):
+            _bake_targets[self.index].selected = not _bake_targets[self.index].selected
+        return {'FINISHED'}
+
+class NODEHELPER_OT_bake_parallel(Operator):
+    bl_idname = "nodehelper.bake_parallel"
+    bl_label = "Bake Selected in Background"
+    bl_description = "Bake the selected targets with several background Blender processes"
+
+    _timer = None
+
+    @classmethod
+    def poll(cls, context):
+        return not _bake_job['running'] and any(target.selected for target in _bake_targets)
+
+    def execute(self, context):
+        if not bpy.data.filepath or bpy.data.is_dirty:
+            self.report({'ERROR'}, "Save the file first, the background processes bake from the saved file")
+            return {'CANCELLED'}
+
+        targets = [target for target in _bake_targets if target.selected]
+        packed = [target for target in targets if target.status == 'PACKED']
+        if packed:
+            self.report({'ERROR'}, f"{len(packed)} target(s) bake into the .blend file, switch them to disk first")
+            return {'CANCELLED'}
+        # A directory filled in by a worker only exists in its unsaved copy of the file
+        without_path = [target for target in targets if not target.path]
+        if without_path:
+            self.report({'ERROR'}, f"{len(without_path)} target(s) have no bake directory, set one on the modifier and save first")
+            return {'CANCELLED'}
+
+        # One worker per chunk, never more than the configured number of Blender processes
+        worker_count = max(1, min(context.scene.nodehelper_bake_max_workers, len(targets)))
+        chunks = [targets[i::worker_count] for i in range(worker_count)]
+        cli_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cli.py")
+
+        self._messages = queue.Queue()
+        self._processes = []
+        for chunk in chunks:
+            command = [
+                bpy.app.binary_path, "--background", "--factory-startup", *PYTHON_EXIT_CODE, bpy.data.filepath,
+                "--python", cli_path, "--", "bake", "--worker",
+                "--targets", json.dumps([target.key for target in chunk]),
+            ]
+            process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+            threading.Thread(target=_relay_output, args=(process, self._messages), daemon=True).start()
+            self._processes.append(process)
+            for target in chunk:
+                target.progress = "Queued"
+
+        _bake_job.update(running=True, cancel=False, done=0, total=len(targets))
+        context.window_manager.progress_begin(0, len(targets))
+        self._timer = context.window_manager.event_timer_add(0.5, window=context.window)
+        context.window_manager.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if (event.type == 'ESC' and event.value == 'PRESS') or _bake_job['cancel']:
+            for process in self._processes:
+                if process.poll() is None:
+                    process.terminate()
+            for target in _bake_targets:
+                if target.progress in {"Queued", "Baking"}:
+                    target.progress = "Cancelled"
+            self.finish(context)
+            self.report({'WARNING'}, "Bake cancelled")
+            return {'CANCELLED'}
+
+        if event.type == 'TIMER':
+            self.drain_messages()
+            context.window_manager.progress_update(_bake_job['done'])
+            for area in context.screen.areas:
+                if area.type == 'NODE_EDITOR':
+                    area.tag_redraw()
+            if all(process.poll() is not None for process in self._processes):
+                self.drain_messages()
+                # A worker that died before reporting leaves its targets unfinished
+                for target in _bake_targets:
+                    if target.progress in {"Queued", "Baking"}:
+                        target.progress = "Failed"
+                self.finish(context)
+                self.report({'INFO'}, f"Baked {_bake_job['done']}/{_bake_job['total']} target(s)")
+                return {'FINISHED'}
+
+        return {'PASS_THROUGH'}
+
+    def drain_messages(self):
+        targets = {tuple(target.key): target for target in _bake_targets}
+        while not self._messages.empty():
+            message = self._messages.get()
+            target = targets.get(tuple(message.get("target", ())))
+            if not target:
+                continue
+            status = message.get("status")
+            if status == "started":
+                target.progress = "Baking"
+            elif status == "done":
+                target.progress = "Done"
+                _bake_job['done'] += 1
+            else:
+                target.progress = message.get("error", "Failed")
+
+    def finish(self, context):
+        context.window_manager.event_timer_remove(self._timer)
+        context.window_manager.progress_end()
+        _bake_job.update(running=False, cancel=False)
+        # Pick up the new caches from disk
+        for target in _bake_targets:
+            obj = bpy.data.objects.get(target.object_name)
+            if obj and target.progress == "Done":
+                obj.update_tag()
+        bpy.ops.nodehelper.refresh_bake_targets()
+
+class NODEHELPER_OT_cancel_bake(Operator):
+    bl_idname = "nodehelper.cancel_bake"
+    bl_label = "Cancel Bake"
+    bl_description = "Stop the running background bake"
+
+    def execute(self, context):
+        _bake_job['cancel'] = True
+        return {'FINISHED'}
+
+class NODEHELPER_UL_bake_targets(UIList):
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        if index >= len(_bake_targets):
+            return
+        target = _bake_targets[index]
+        icons = {'BAKE': 'FILE_CACHE', 'SIMULATION': 'PHYSICS'}
+        row = layout.row(align=True)
+        op = row.operator("nodehelper.toggle_bake_target", text="", icon='CHECKBOX_HLT' if target.selected else 'CHECKBOX_DEHLT', emboss=False)
+        op.index = index
+        row.label(text=f"{target.object_name} > {target.node_name}", icon=icons[target.kind])
+        row.label(text=target.progress or f"{target.status.title()} {format_size(target.size) if target.size else ''}")
+
+class NODEHELPER_PT_bake(Panel):
+    bl_label = "Bake Manager"
+    bl_idname = "NODEHELPER_PT_bake"
+    bl_space_type = 'NODE_EDITOR'
+    bl_region_type = 'UI'
+    bl_category = "NodeHelper"
+
+    @classmethod
+    def poll(cls, context):
+        return context.space_data.type == 'NODE_EDITOR' and context.space_data.tree_type == 'GeometryNodeTree'
+
+    def draw(self, context):
+        layout = self.layout
+
+        box = layout.box()
+        row = box.row(align=True)
+        row.operator("nodehelper.refresh_bake_targets", text="Refresh", icon='FILE_REFRESH')
+        row.operator("nodehelper.toggle_bake_target", text="Select Outdated").index = -1
+
+        if _bake_targets:
+            wm = context.window_manager
+            box.template_list("NODEHELPER_UL_bake_targets", "", wm, "nodehelper_bake_rows", wm, "nodehelper_active_bake_index", rows=5)
+
+        box.prop(context.scene, "nodehelper_bake_max_workers", text="Max Workers")
+        row = box.row()
+        row.scale_y = 1.5
+        if _bake_job['running']:
+            row.label(text=f"Baking {_bake_job['done']}/{_bake_job['total']}")
+            row.operator("nodehelper.cancel_bake", text="Cancel", icon='X')
+        else:
+            row.operator("nodehelper.bake_parallel", text="Bake Selected", icon='RENDER_STILL')
+
+def register():
+    bpy.utils.register_class(BakeTargetRow)
+    bpy.utils.register_class(NODEHELPER_OT_refresh_bake_targets)
+    bpy.utils.register_class(NODEHELPER_OT_toggle_bake_target)
+    bpy.utils.register_class(NODEHELPER_OT_bake_parallel)
+    bpy.utils.register_class(NODEHELPER_OT_cancel_bake)
+    bpy.utils.register_class(NODEHELPER_UL_bake_targets)
+    bpy.utils.register_class(NODEHELPER_PT_bake)
+    bpy.types.WindowManager.nodehelper_bake_rows = CollectionProperty(type=BakeTargetRow)
+    bpy.types.WindowManager.nodehelper_active_bake_index = IntProperty()
+    bpy.types.Scene.nodehelper_bake_max_workers = IntProperty(
+        name="Max Bake Workers",
+        description="Maximum number of background Blender processes baking at the same time",
+        default=2,
+        min=1,
+        max=64
+    )
+
+def unregister():
+    del bpy.types.Scene.nodehelper_bake_max_workers
+    _bake_targets.clear()
+    del bpy.types.WindowManager.nodehelper_active_bake_index
+    del bpy.types.WindowManager.nodehelper_bake_rows
+    bpy.utils.unregister_class(NODEHELPER_PT_bake)
+    bpy.utils.unregister_class(NODEHELPER_UL_bake_targets)
+    bpy.utils.unregister_class(NODEHELPER_OT_cancel_bake)
+    bpy.utils.unregister_class(NODEHELPER_OT_bake_parallel)
+    bpy.utils.unregister_class(NODEHELPER_OT_toggle_bake_target)
+    bpy.utils.unregister_class(NODEHELPER_OT_refresh_bake_targets)
+    bpy.utils.unregister_class(BakeTargetRow)
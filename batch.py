@@ -0,0 +1,87 @@
+import bpy
+
+# Stack of open batches; only the outermost one flushes
+_active_batches = []
+
+class UpdateBatch:
+    def __init__(self, context=None):
+        self.context = context
+        self.trees = {}
+        self.view_layers = {}
+        self.area_types = set()
+
+    def __enter__(self):
+        _active_batches.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _active_batches.remove(self)
+        if _active_batches:
+            # Hand pending work to the enclosing batch
+            outer = _active_batches[-1]
+            outer.trees.update(self.trees)
+            outer.view_layers.update(self.view_layers)
+            outer.area_types |= self.area_types
+            if outer.context is None:
+                outer.context = self.context
+        else:
+            self.flush()
+        return False
+
+    def flush(self):
+        for tree in self.trees.values():
+            try:
+                tree.update_tag()
+            except ReferenceError:
+                # The tree was removed during the batch
+                pass
+
+        for view_layer in self.view_layers.values():
+            view_layer.update()
+
+        if self.area_types:
+            screen = self.context.screen if self.context else bpy.context.screen
+            if screen:
+                for area in screen.areas:
+                    if area.type in self.area_types:
+                        area.tag_redraw()
+
+        self.trees.clear()
+        self.view_layers.clear()
+        self.area_types.clear()
+
+def batch_updates(context=None):
+    return UpdateBatch(context)
+
+def _current_batch():
+    return _active_batches[-1] if _active_batches else None
+
+def tag_tree_update(tree):
+    if not tree:
+        return
+    batch = _current_batch()
+    if batch is None:
+        tree.update_tag()
+    else:
+        batch.trees[tree.as_pointer()] = tree
+
+def tag_view_layer_update(context):
+    view_layer = context.view_layer
+    if not view_layer:
+        return
+    batch = _current_batch()
+    if batch is None:
+        view_layer.update()
+    else:
+        batch.view_layers[view_layer.as_pointer()] = view_layer
+
+def tag_redraw(context, area_type='NODE_EDITOR'):
+    batch = _current_batch()
+    if batch is None:
+        for area in context.screen.areas:
+            if area.type == area_type:
+                area.tag_redraw()
+    else:
+        if batch.context is None:
+            batch.context = context
+        batch.area_types.add(area_type)
@@ -0,0 +1,266 @@
+# Headless NodeHelper audits.
+#
+# Inside Blender (one file):
+#   blender -b file.blend --python-exit-code 1 --python cli.py -- audit
+#   blender -b file.blend --python-exit-code 1 --python-expr "import nodehelper.cli; nodehelper.cli.main()" -- audit
+#
+# In background mode a failed audit or bake exits Blender with a non-zero code.
+#
+# Bake targets of the open file, used by the Bake Manager's background workers:
+#   blender -b file.blend --python-exit-code 1 --python cli.py -- bake --targets '[["Object", "GeometryNodes", 123]]'
+#
+# Outside Blender (many files, fanned out over background Blender workers):
+#   python cli.py scan /path/to/assets --blender /path/to/blender --jobs 8 > audit.jsonl
+#
+# Every result is written as one JSON object per line.
+
+import argparse
+import importlib
+import json
+import os
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Run when no --analyses are given; "tree_hashes" is only run on request
+ANALYSES = ("named_attributes", "unused_sockets", "group_inputs", "group_usage")
+
+# Marks our lines in a worker's stdout, Blender prints its own messages there too
+LINE_PREFIX = "NODEHELPER_JSON "
+
+# Makes a background Blender exit with 1 when the script raises, instead of 0
+PYTHON_EXIT_CODE = ["--python-exit-code", "1"]
+
+def _load_addon():
+    # Works both when imported as part of the installed add-on and when run as a plain script
+    if __package__:
+        return importlib.import_module(__package__)
+    addon_dir = os.path.dirname(os.path.abspath(__file__))
+    sys.path.insert(0, os.path.dirname(addon_dir))
+    return importlib.import_module(os.path.basename(addon_dir))
+
+def _geometry_trees():
+    import bpy
+    return [tree for tree in bpy.data.node_groups if tree.bl_idname == 'GeometryNodeTree']
+
+def audit_named_attributes(search_name=""):
+    attribute = importlib.import_module(".attribute", _load_addon().__name__)
+    search_name = search_name.lower()
+    # Same scan as the Find operator; the shared set reports a node once, under the group it lives in
+    found_nodes = set()
+    for tree in _geometry_trees():
+        for _, node, attribute_name, _ in attribute.iter_named_attributes(tree, search_name, found_nodes=found_nodes):
+            yield {"tree": node.id_data.name, "node": node.name, "node_type": node.bl_idname, "attribute": attribute_name}
+
+def audit_unused_sockets():
+    group_input = importlib.import_module(".group_input", _load_addon().__name__)
+    for tree in _geometry_trees():
+        # Unused means no Group Input node links it; one unlinked copy among several is not enough
+        unused = sorted(name for name, nodes in group_input.find_group_input_users(tree).items() if name and not nodes)
+        if unused:
+            yield {"tree": tree.name, "unused_sockets": unused}
+
+def audit_group_inputs():
+    group_input = importlib.import_module(".group_input", _load_addon().__name__)
+    for tree in _geometry_trees():
+        users = group_input.find_group_input_users(tree)
+        if users:
+            yield {"tree": tree.name, "inputs": users, "unconnected": sorted(name for name, nodes in users.items() if not nodes)}
+
+def audit_group_usage():
+    usage = importlib.import_module(".usage", _load_addon().__name__)
+    index = usage.GroupUsageIndex()
+    for tree in _geometry_trees():
+        uid = tree.session_uid
+        group_users, modifier_users = index.direct_users(tree)
+        yield {
+            "tree": tree.name,
+            "group_users": [[index.trees[parent_uid].name, node_name] for parent_uid, node_name in group_users],
+            "modifier_users": [[object_name, modifier_name] for object_name, modifier_name in modifier_users],
+            "parent_groups": len(index.ancestors(uid)),
+            "instances": index.instance_count(uid),
+            "depth": index.max_depth(uid),
+        }
+
+def audit_tree_hashes():
+    hashing = importlib.import_module(".hashing", _load_addon().__name__)
+    for tree in _geometry_trees():
+        yield {"tree": tree.name, "hash": hashing.tree_hash(tree)}
+
+AUDITS = {
+    "named_attributes": audit_named_attributes,
+    "unused_sockets": audit_unused_sockets,
+    "group_inputs": audit_group_inputs,
+    "group_usage": audit_group_usage,
+    "tree_hashes": audit_tree_hashes,
+}
+
+def emit(record, stream=None, prefix=""):
+    stream = stream or sys.stdout
+    stream.write(prefix + json.dumps(record, sort_keys=True) + "\n")
+    stream.flush()
+
+def run_audits(analyses, attribute_search="", prefix=""):
+    # Returns the number of analyses that failed
+    import bpy
+    filepath = bpy.data.filepath
+    failures = 0
+    for analysis in analyses:
+        try:
+            if analysis == "named_attributes":
+                records = AUDITS[analysis](attribute_search)
+            else:
+                records = AUDITS[analysis]()
+            for record in records:
+                record["file"] = filepath
+                record["analysis"] = analysis
+                emit(record, prefix=prefix)
+        except Exception as e:
+            emit({"file": filepath, "analysis": analysis, "error": str(e)}, prefix=prefix)
+            failures += 1
+    return failures
+
+def audit_files(filepaths, analyses, attribute_search="", prefix=""):
+    import bpy
+    if not filepaths:
+        return run_audits(analyses, attribute_search, prefix)
+    failures = 0
+    for filepath in filepaths:
+        try:
+            bpy.ops.wm.open_mainfile(filepath=filepath, load_ui=False)
+        except Exception as e:
+            emit({"file": filepath, "error": f"Failed to open: {e}"}, prefix=prefix)
+            failures += 1
+            continue
+        failures += run_audits(analyses, attribute_search, prefix)
+    return failures
+
+def bake_targets(targets, prefix=""):
+    import bpy
+    bake = importlib.import_module(".bake", _load_addon().__name__)
+    hashing = importlib.import_module(".hashing", _load_addon().__name__)
+    failures = 0
+    for object_name, modifier_name, bake_id in targets:
+        key = [object_name, modifier_name, bake_id]
+        obj = bpy.data.objects.get(object_name)
+        modifier = obj.modifiers.get(modifier_name) if obj else None
+        bake_item = next((item for item in modifier.bakes if item.bake_id == bake_id), None) if modifier else None
+        if bake_item is None:
+            emit({"target": key, "status": "error", "error": "Bake target not found"}, prefix=prefix)
+            failures += 1
+            continue
+
+        emit({"target": key, "status": "started"}, prefix=prefix)
+        try:
+            bpy.ops.object.geometry_node_bake_single(session_uid=obj.session_uid, modifier_name=modifier_name, bake_id=bake_id)
+            path = bake.bake_cache_path(modifier, bake_item)
+            if path and os.path.isdir(path):
+                bake.write_bake_stamp(path, hashing.modifier_digest(modifier))
+        except Exception as e:
+            emit({"target": key, "status": "error", "error": str(e)}, prefix=prefix)
+            failures += 1
+            continue
+        emit({"target": key, "status": "done"}, prefix=prefix)
+    return failures
+
+def find_blend_files(directory):
+    for root, _, files in os.walk(directory):
+        for name in sorted(files):
+            if name.endswith(".blend"):
+                yield os.path.join(root, name)
+
+def _worker_command(blender, filepaths, analyses, attribute_search):
+    command = [
+        blender, "--background", "--factory-startup", *PYTHON_EXIT_CODE,
+        "--python", os.path.abspath(__file__),
+        "--", "audit", "--worker",
+        "--analyses", ",".join(analyses),
+        "--attribute-search", attribute_search,
+    ]
+    return command + list(filepaths)
+
+def scan(directory, blender, jobs, chunk_size, analyses, attribute_search="", output=None):
+    output = output or sys.stdout
+    filepaths = list(find_blend_files(directory))
+    chunks = [filepaths[i:i + chunk_size] for i in range(0, len(filepaths), chunk_size)]
+    lock = threading.Lock()
+
+    def run_worker(chunk):
+        # Each worker is a separate background Blender process, the thread only relays its output
+        process = subprocess.Popen(
+            _worker_command(blender, chunk, analyses, attribute_search),
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+        )
+        for line in process.stdout:
+            if line.startswith(LINE_PREFIX):
+                with lock:
+                    output.write(line[len(LINE_PREFIX):])
+                    output.flush()
+        return process.wait(), chunk
+
+    failures = 0
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        futures = [executor.submit(run_worker, chunk) for chunk in chunks]
+        for future in as_completed(futures):
+            returncode, chunk = future.result()
+            if returncode != 0:
+                failures += 1
+                with lock:
+                    emit({"files": chunk, "error": f"Worker exited with code {returncode}"}, output)
+    return failures
+
+def _parse_analyses(value):
+    analyses = [name.strip() for name in value.split(",") if name.strip()]
+    unknown = [name for name in analyses if name not in AUDITS]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"Unknown analysis: {', '.join(unknown)}")
+    return analyses
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="nodehelper", description="NodeHelper headless audits")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    audit = subparsers.add_parser("audit", help="Audit the open .blend file (run inside Blender)")
+    audit.add_argument("files", nargs="*", help="Open and audit these .blend files one after another")
+    audit.add_argument("--analyses", type=_parse_analyses, default=list(ANALYSES))
+    audit.add_argument("--attribute-search", default="")
+    audit.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+
+    bake_parser = subparsers.add_parser("bake", help="Bake Bake nodes and simulation zones of the open file (run inside Blender)")
+    bake_parser.add_argument("--targets", type=json.loads, required=True, help="JSON list of [object, modifier, bake_id]")
+    bake_parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+
+    scan_parser = subparsers.add_parser("scan", help="Audit every .blend file below a directory in parallel")
+    scan_parser.add_argument("directory")
+    scan_parser.add_argument("--blender", default="blender", help="Blender executable used for the workers")
+    scan_parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Number of concurrent Blender workers")
+    scan_parser.add_argument("--chunk-size", type=int, default=8, help="Files opened by each worker process")
+    scan_parser.add_argument("--analyses", type=_parse_analyses, default=list(ANALYSES))
+    scan_parser.add_argument("--attribute-search", default="")
+    return parser
+
+def main(argv=None):
+    if argv is None:
+        # Inside Blender our arguments follow "--"
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]
+    args = build_parser().parse_args(argv)
+
+    if args.command == "audit":
+        prefix = LINE_PREFIX if args.worker else ""
+        code = 1 if audit_files(args.files, args.analyses, args.attribute_search, prefix) else 0
+    elif args.command == "bake":
+        code = 1 if bake_targets(args.targets, LINE_PREFIX if args.worker else "") else 0
+    else:
+        return 1 if scan(args.directory, args.blender, args.jobs, args.chunk_size, args.analyses, args.attribute_search) else 0
+
+    # A background Blender otherwise exits with 0 once the script returns
+    import bpy
+    if code and bpy.app.background:
+        sys.exit(code)
+    return code
+
+if __name__ == "__main__":
+    code = main()
+    if "bpy" not in sys.modules:
+        sys.exit(code)
@@ -0,0 +1,406 @@
+import bpy
+import math
+from bpy.types import Operator, Panel
+from bpy.props import BoolProperty
+from .batch import batch_updates, tag_tree_update, tag_redraw
+from .node_utils import replace_node_with_type
+from .snapshot import TreeSnapshot
+
+SOURCE_NODES = {'ShaderNodeValue', 'FunctionNodeInputVector', 'FunctionNodeInputBool', 'FunctionNodeInputInt'}
+FOLDABLE_NODES = {'ShaderNodeMath', 'ShaderNodeVectorMath', 'FunctionNodeCompare', 'FunctionNodeBooleanMath'}
+FLT_EPSILON = 1.1920928955078125e-07
+
+def _safe_divide(a, b):
+    return a / b if b != 0.0 else 0.0
+
+def _safe_power(a, b):
+    if a >= 0.0 or float(b).is_integer():
+        try:
+            return math.pow(a, b)
+        except (OverflowError, ValueError, ZeroDivisionError):
+            return 0.0
+    return 0.0
+
+def _safe_log(a, b):
+    if a > 0.0 and b > 0.0 and b != 1.0:
+        return math.log(a) / math.log(b)
+    return 0.0
+
+def _floored_modulo(a, b):
+    return a - math.floor(a / b) * b if b != 0.0 else 0.0
+
+MATH_OPERATIONS = {
+    'ADD': lambda a, b, c: a + b,
+    'SUBTRACT': lambda a, b, c: a - b,
+    'MULTIPLY': lambda a, b, c: a * b,
+    'DIVIDE': lambda a, b, c: _safe_divide(a, b),
+    'MULTIPLY_ADD': lambda a, b, c: a * b + c,
+    'POWER': lambda a, b, c: _safe_power(a, b),
+    'LOGARITHM': lambda a, b, c: _safe_log(a, b),
+    'SQRT': lambda a, b, c: math.sqrt(a) if a > 0.0 else 0.0,
+    'INVERSE_SQRT': lambda a, b, c: 1.0 / math.sqrt(a) if a > 0.0 else 0.0,
+    'ABSOLUTE': lambda a, b, c: abs(a),
+    'EXPONENT': lambda a, b, c: math.exp(a),
+    'MINIMUM': lambda a, b, c: min(a, b),
+    'MAXIMUM': lambda a, b, c: max(a, b),
+    'LESS_THAN': lambda a, b, c: 1.0 if a < b else 0.0,
+    'GREATER_THAN': lambda a, b, c: 1.0 if a > b else 0.0,
+    'SIGN': lambda a, b, c: math.copysign(1.0, a) if a != 0.0 else 0.0,
+    'COMPARE': lambda a, b, c: 1.0 if abs(a - b) <= max(c, FLT_EPSILON) else 0.0,
+    'ROUND': lambda a, b, c: math.floor(a + 0.5),
+    'FLOOR': lambda a, b, c: math.floor(a),
+    'CEIL': lambda a, b, c: math.ceil(a),
+    'TRUNC': lambda a, b, c: math.trunc(a),
+    'FRACT': lambda a, b, c: a - math.floor(a),
+    'MODULO': lambda a, b, c: math.fmod(a, b) if b != 0.0 else 0.0,
+    'FLOORED_MODULO': lambda a, b, c: _floored_modulo(a, b),
+    'SNAP': lambda a, b, c: math.floor(a / b) * b if b != 0.0 else 0.0,
+    'SINE': lambda a, b, c: math.sin(a),
+    'COSINE': lambda a, b, c: math.cos(a),
+    'TANGENT': lambda a, b, c: math.tan(a),
+    'ARCSINE': lambda a, b, c: math.asin(min(max(a, -1.0), 1.0)),
+    'ARCCOSINE': lambda a, b, c: math.acos(min(max(a, -1.0), 1.0)),
+    'ARCTANGENT': lambda a, b, c: math.atan(a),
+    'ARCTAN2': lambda a, b, c: math.atan2(a, b),
+    'SINH': lambda a, b, c: math.sinh(a),
+    'COSH': lambda a, b, c: math.cosh(a),
+    'TANH': lambda a, b, c: math.tanh(a),
+    'RADIANS': lambda a, b, c: math.radians(a),
+    'DEGREES': lambda a, b, c: math.degrees(a),
+}
+
+def _per_component(function):
+    return lambda a, b, c, scale: tuple(function(x, y, z) for x, y, z in zip(a, b, c))
+
+def _length(v):
+    return math.sqrt(sum(x * x for x in v))
+
+def _normalize(v):
+    length = _length(v)
+    return tuple(x / length for x in v) if length != 0.0 else (0.0, 0.0, 0.0)
+
+def _cross(a, b):
+    return (a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0])
+
+# Operations returning a float come out of the "Value" socket, the rest out of "Vector"
+VECTOR_MATH_OPERATIONS = {
+    'ADD': _per_component(lambda x, y, z: x + y),
+    'SUBTRACT': _per_component(lambda x, y, z: x - y),
+    'MULTIPLY': _per_component(lambda x, y, z: x * y),
+    'DIVIDE': _per_component(lambda x, y, z: _safe_divide(x, y)),
+    'MULTIPLY_ADD': _per_component(lambda x, y, z: x * y + z),
+    'CROSS_PRODUCT': lambda a, b, c, scale: _cross(a, b),
+    'DOT_PRODUCT': lambda a, b, c, scale: sum(x * y for x, y in zip(a, b)),
+    'DISTANCE': lambda a, b, c, scale: _length(tuple(x - y for x, y in zip(a, b))),
+    'LENGTH': lambda a, b, c, scale: _length(a),
+    'SCALE': lambda a, b, c, scale: tuple(x * scale for x in a),
+    'NORMALIZE': lambda a, b, c, scale: _normalize(a),
+    'ABSOLUTE': _per_component(lambda x, y, z: abs(x)),
+    'MINIMUM': _per_component(lambda x, y, z: min(x, y)),
+    'MAXIMUM': _per_component(lambda x, y, z: max(x, y)),
+    'FLOOR': _per_component(lambda x, y, z: math.floor(x)),
+    'CEIL': _per_component(lambda x, y, z: math.ceil(x)),
+    'FRACTION': _per_component(lambda x, y, z: x - math.floor(x)),
+    'MODULO': _per_component(lambda x, y, z: math.fmod(x, y) if y != 0.0 else 0.0),
+    'SINE': _per_component(lambda x, y, z: math.sin(x)),
+    'COSINE': _per_component(lambda x, y, z: math.cos(x)),
+    'TANGENT': _per_component(lambda x, y, z: math.tan(x)),
+}
+
+BOOLEAN_OPERATIONS = {
+    'AND': lambda a, b: a and b,
+    'OR': lambda a, b: a or b,
+    'NOT': lambda a, b: not a,
+    'NAND': lambda a, b: not (a and b),
+    'NOR': lambda a, b: not (a or b),
+    'XNOR': lambda a, b: a == b,
+    'XOR': lambda a, b: a != b,
+    'IMPLY': lambda a, b: (not a) or b,
+    'NIMPLY': lambda a, b: a and not b,
+}
+
+COMPARE_OPERATIONS = {
+    'LESS_THAN': lambda a, b, epsilon: a < b,
+    'LESS_EQUAL': lambda a, b, epsilon: a <= b,
+    'GREATER_THAN': lambda a, b, epsilon: a > b,
+    'GREATER_EQUAL': lambda a, b, epsilon: a >= b,
+    'EQUAL': lambda a, b, epsilon: abs(a - b) <= epsilon,
+    'NOT_EQUAL': lambda a, b, epsilon: abs(a - b) > epsilon,
+}
+
+def convert_value(value, socket_type):
+    # Blender's implicit conversions between the socket types we fold; None when not supported
+    if isinstance(value, tuple):
+        if socket_type == 'VECTOR':
+            return value
+        # Vector to boolean is not folded, only the float conversion (component average) is
+        return sum(value) / 3.0 if socket_type == 'VALUE' else None
+    if isinstance(value, bool):
+        number = 1.0 if value else 0.0
+        return {'VALUE': number, 'VECTOR': (number,) * 3, 'BOOLEAN': value, 'INT': int(value)}.get(socket_type)
+    if isinstance(value, int):
+        return {'VALUE': float(value), 'VECTOR': (float(value),) * 3, 'BOOLEAN': value > 0, 'INT': value}.get(socket_type)
+    if isinstance(value, float):
+        return {'VALUE': value, 'VECTOR': (value,) * 3, 'BOOLEAN': value > 0.0}.get(socket_type)
+    return None
+
+class ConstantEvaluator:
+    def __init__(self, tree):
+        self.tree = tree
+        self.values = {}
+
+    def input_value(self, socket):
+        # Value arriving at an input: the unlinked default or the constant output feeding it
+        links = [link for link in socket.links if not link.is_muted]
+        if not links:
+            if not hasattr(socket, "default_value"):
+                return None
+            value = socket.default_value
+            if socket.type == 'VECTOR':
+                return tuple(value)
+            return convert_value(value, socket.type)
+        if len(links) > 1:
+            return None
+        from_socket = links[0].from_socket
+        outputs = self.evaluate(from_socket.node)
+        if outputs is None or from_socket.identifier not in outputs:
+            return None
+        return convert_value(outputs[from_socket.identifier], socket.type)
+
+    def evaluate(self, node):
+        # Constant values of the node's outputs keyed by identifier, or None when the node is not constant
+        if node.name in self.values:
+            return self.values[node.name]
+        self.values[node.name] = None
+        if node.mute:
+            return None
+        try:
+            result = self._evaluate(node)
+        except (ArithmeticError, ValueError, TypeError, IndexError, RecursionError):
+            result = None
+        self.values[node.name] = result
+        return result
+
+    def _evaluate(self, node):
+        idname = node.bl_idname
+        if idname == 'ShaderNodeValue':
+            return {node.outputs[0].identifier: float(node.outputs[0].default_value)}
+        if idname == 'FunctionNodeInputVector':
+            return {node.outputs[0].identifier: tuple(node.vector)}
+        if idname == 'FunctionNodeInputBool':
+            return {node.outputs[0].identifier: bool(node.boolean)}
+        if idname == 'FunctionNodeInputInt':
+            return {node.outputs[0].identifier: int(node.integer)}
+        if idname == 'NodeReroute':
+            value = self.input_value(node.inputs[0])
+            return None if value is None else {node.outputs[0].identifier: value}
+
+        if idname == 'ShaderNodeMath':
+            operation = MATH_OPERATIONS.get(node.operation)
+            if not operation:
+                return None
+            args = [self.input_value(socket) if socket.enabled else 0.0 for socket in node.inputs[:3]]
+            if None in args:
+                return None
+            value = float(operation(*args))
+            if node.use_clamp:
+                value = min(max(value, 0.0), 1.0)
+            return {node.outputs[0].identifier: value}
+
+        if idname == 'ShaderNodeVectorMath':
+            operation = VECTOR_MATH_OPERATIONS.get(node.operation)
+            if not operation:
+                return None
+            vectors = [self.input_value(socket) if socket.enabled else (0.0, 0.0, 0.0) for socket in node.inputs[:3]]
+            scale = self.input_value(node.inputs[3]) if node.inputs[3].enabled else 1.0
+            if None in vectors or scale is None:
+                return None
+            value = operation(*vectors, scale)
+            output = node.outputs[1] if isinstance(value, float) else node.outputs[0]
+            return {output.identifier: value}
+
+        if idname == 'FunctionNodeBooleanMath':
+            operation = BOOLEAN_OPERATIONS.get(node.operation)
+            a = self.input_value(node.inputs[0])
+            b = self.input_value(node.inputs[1]) if node.inputs[1].enabled else False
+            if not operation or a is None or b is None:
+                return None
+            return {node.outputs[0].identifier: bool(operation(a, b))}
+
+        if idname == 'FunctionNodeCompare':
+            operation = COMPARE_OPERATIONS.get(node.operation)
+            identifiers = {'FLOAT': ('A', 'B'), 'INT': ('A_INT', 'B_INT')}.get(node.data_type)
+            if not operation or not identifiers or getattr(node, "mode", 'ELEMENT') != 'ELEMENT':
+                return None
+            sockets = {socket.identifier: socket for socket in node.inputs}
+            a = self.input_value(sockets[identifiers[0]])
+            b = self.input_value(sockets[identifiers[1]])
+            epsilon = self.input_value(sockets['Epsilon']) if node.data_type == 'FLOAT' else 0
+            if a is None or b is None or epsilon is None:
+                return None
+            return {node.outputs[0].identifier: bool(operation(a, b, epsilon))}
+
+        return None
+
+def topological_order(snapshot):
+    # Kahn's algorithm over unmuted links; nodes on a cycle are left out
+    offsets, targets = snapshot.adjacency()
+    offsets = offsets.tolist()
+    targets = targets.tolist()
+    in_degree = [0] * snapshot.node_count
+    for target in targets:
+        in_degree[target] += 1
+    order = [i for i, degree in enumerate(in_degree) if degree == 0]
+    for current in order:
+        for target in targets[offsets[current]:offsets[current + 1]]:
+            in_degree[target] -= 1
+            if in_degree[target] == 0:
+                order.append(target)
+    return order
+
+def _consumers(socket):
+    # Nodes fed by an output, looking through reroutes
+    nodes = []
+    for link in socket.links:
+        if link.is_muted:
+            continue
+        if link.to_node.bl_idname == 'NodeReroute':
+            nodes.extend(_consumers(link.to_node.outputs[0]))
+        else:
+            nodes.append(link.to_node)
+    return nodes
+
+def fold_constants(tree):
+    # Replace every maximal constant Math/Vector Math/Compare/Boolean Math chain with one input node.
+    # Returns the number of nodes removed from the tree.
+    evaluator = ConstantEvaluator(tree)
+    # Evaluate upstream nodes first so the recursion in input_value stops at memoized results
+    snapshot = TreeSnapshot(tree)
+    for index in topological_order(snapshot):
+        node = snapshot.nodes[index]
+        if node.bl_idname in FOLDABLE_NODES | SOURCE_NODES | {'NodeReroute'}:
+            evaluator.evaluate(node)
+    constant = {name for name, outputs in evaluator.values.items() if outputs is not None}
+    had_links = {node.name for node in tree.nodes if node.name in constant and any(output.links for output in node.outputs)}
+
+    roots = []
+    for node in tree.nodes:
+        if node.bl_idname not in FOLDABLE_NODES or node.name not in constant:
+            continue
+        linked = [output for output in node.outputs if output.links]
+        if len(linked) != 1:
+            continue
+        # Skip links on an output the current operation does not use
+        if linked[0].identifier not in evaluator.values[node.name]:
+            continue
+        if any(consumer.name not in constant for consumer in _consumers(linked[0])):
+            roots.append((node.name, linked[0].identifier))
+
+    node_count = len(tree.nodes)
+    for name, identifier in roots:
+        node = tree.nodes[name]
+        had_links.discard(name)
+        value = evaluator.values[name][identifier]
+        label = node.label or node.name
+        # replace_node_with_type matches outputs by name or type, which misses e.g. a Compare
+        # "Result" feeding a float input, so the outgoing links are rebuilt below
+        output = next(output for output in node.outputs if output.identifier == identifier)
+        outgoing = [(link.to_socket, link.is_muted) for link in output.links]
+        if isinstance(value, tuple):
+            new_node = replace_node_with_type(tree, node, 'FunctionNodeInputVector')
+            if new_node:
+                new_node.vector = value
+        elif isinstance(value, bool):
+            new_node = replace_node_with_type(tree, node, 'FunctionNodeInputBool')
+            if new_node:
+                new_node.boolean = value
+        else:
+            new_node = replace_node_with_type(tree, node, 'ShaderNodeValue')
+            if new_node:
+                new_node.outputs[0].default_value = value
+        if new_node:
+            new_node.label = label
+            for to_socket in {to_socket for to_socket, _ in outgoing}:
+                for link in list(to_socket.links):
+                    if link.from_node == new_node:
+                        tree.links.remove(link)
+            for to_socket, is_muted in outgoing:
+                tree.links.new(new_node.outputs[0], to_socket).is_muted = is_muted
+
+    # Drop the rest of the folded chains, which no longer feed anything
+    removed = True
+    while removed:
+        removed = False
+        for node in list(tree.nodes):
+            if node.name in had_links and not any(output.links for output in node.outputs):
+                had_links.discard(node.name)
+                tree.nodes.remove(node)
+                removed = True
+
+    return node_count - len(tree.nodes)
+
+class NODEHELPER_OT_fold_constants(Operator):
+    bl_idname = "nodehelper.fold_constants"
+    bl_label = "Fold Constants"
+    bl_description = "Replace Math, Vector Math, Compare and Boolean Math chains with constant inputs by a single Value, Vector or Boolean node"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    all_groups: BoolProperty(
+        name="All Node Groups",
+        description="Fold constants in every geometry node group instead of only the edited one",
+        default=False
+    )
+
+    def execute(self, context):
+        if self.all_groups:
+            trees = [tree for tree in bpy.data.node_groups if tree.bl_idname == 'GeometryNodeTree' and not tree.library]
+        else:
+            tree = context.space_data.edit_tree
+            if not tree or tree.bl_idname != 'GeometryNodeTree':
+                self.report({'ERROR'}, "No Geometry Node tree is currently being edited.")
+                return {'CANCELLED'}
+            trees = [tree]
+
+        removed_per_group = {}
+        with batch_updates(context):
+            for tree in trees:
+                removed = fold_constants(tree)
+                if removed:
+                    removed_per_group[tree.name] = removed
+                    tag_tree_update(tree)
+            tag_redraw(context)
+
+        if not removed_per_group:
+            self.report({'INFO'}, "No constant chains found")
+        else:
+            details = ", ".join(f"{name}: {count}" for name, count in sorted(removed_per_group.items()))
+            self.report({'INFO'}, f"Removed {sum(removed_per_group.values())} node(s) ({details})")
+        return {'FINISHED'}
+
+class NODEHELPER_PT_const_fold(Panel):
+    bl_label = "Constant Folding"
+    bl_idname = "NODEHELPER_PT_const_fold"
+    bl_space_type = 'NODE_EDITOR'
+    bl_region_type = 'UI'
+    bl_category = "NodeHelper"
+
+    @classmethod
+    def poll(cls, context):
+        return context.space_data.type == 'NODE_EDITOR' and context.space_data.tree_type == 'GeometryNodeTree'
+
+    def draw(self, context):
+        layout = self.layout
+
+        box = layout.box()
+        row = box.row(align=True)
+        row.scale_y = 1.5
+        row.operator("nodehelper.fold_constants", text="Fold Current", icon='DRIVER_TRANSFORM').all_groups = False
+        row.operator("nodehelper.fold_constants", text="Fold All Groups", icon='NODETREE').all_groups = True
+
+def register():
+    bpy.utils.register_class(NODEHELPER_OT_fold_constants)
+    bpy.utils.register_class(NODEHELPER_PT_const_fold)
+
+def unregister():
+    bpy.utils.unregister_class(NODEHELPER_PT_const_fold)
+    bpy.utils.unregister_class(NODEHELPER_OT_fold_constants)
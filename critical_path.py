@@ -0,0 +1,204 @@
+import bpy
+from bpy.types import Operator, Panel, PropertyGroup, UIList
+from bpy.props import StringProperty, IntProperty, CollectionProperty
+from .node_utils import open_node_path, sync_proxy_rows
+from .snapshot import TreeSnapshot
+from . import tree_cache
+
+# Nodes that only route data and cost nothing at evaluation time
+PASSTHROUGH_NODES = {'NodeReroute', 'NodeFrame', 'NodeGroupInput', 'NodeGroupOutput'}
+
+_analysis_cache = tree_cache.TreeCache()
+_group_results = []
+
+class ParallelismRow(PropertyGroup):
+    pass
+
+class TreeParallelism:
+    __slots__ = ("name", "span", "work", "width", "chain")
+
+    def __init__(self, name, span, work, width, chain):
+        self.name = name
+        self.span = span
+        self.work = work
+        self.width = width
+        self.chain = chain
+
+    @property
+    def parallelism(self):
+        return self.work / self.span if self.span else 1.0
+
+def analyse_tree(tree, _visiting=None):
+    # Longest weighted path (span) and total work of a tree, nested groups expanded and memoized
+    cached = _analysis_cache.get(tree)
+    if cached is not None:
+        return cached
+
+    visiting = _visiting if _visiting is not None else set()
+    visiting.add(tree.session_uid)
+
+    snapshot = TreeSnapshot(tree)
+    nodes = snapshot.nodes
+    weights = [0] * len(nodes)
+    work = 0
+    children = []
+    for i, node in enumerate(nodes):
+        if snapshot.node_idnames[i] in PASSTHROUGH_NODES or snapshot.node_mute[i]:
+            continue
+        if snapshot.node_types[i] == 'GROUP':
+            group = node.node_tree
+            if group and group.session_uid not in visiting:
+                child = analyse_tree(group, visiting)
+                children.append(group)
+                weights[i] = child.span
+                work += child.work
+            continue
+        weights[i] = 1
+        work += 1
+
+    offsets, targets = snapshot.adjacency()
+    offsets = offsets.tolist()
+    targets = targets.tolist()
+    in_degree = [0] * len(nodes)
+    for target in targets:
+        in_degree[target] += 1
+
+    # Kahn's algorithm; finish[i] is the longest weighted path ending at node i
+    finish = list(weights)
+    level = [1 if weight else 0 for weight in weights]
+    previous = [None] * len(nodes)
+    ready = [i for i, degree in enumerate(in_degree) if degree == 0]
+    while ready:
+        current = ready.pop()
+        for target in targets[offsets[current]:offsets[current + 1]]:
+            if finish[current] + weights[target] > finish[target]:
+                finish[target] = finish[current] + weights[target]
+                previous[target] = current
+            level[target] = max(level[target], level[current] + (1 if weights[target] else 0))
+            in_degree[target] -= 1
+            if in_degree[target] == 0:
+                ready.append(target)
+
+    span = max(finish, default=0)
+    chain = []
+    if span:
+        current = finish.index(span)
+        while current is not None:
+            if weights[current]:
+                chain.append(nodes[current].name)
+            current = previous[current]
+        chain.reverse()
+
+    per_level = {}
+    for i, weight in enumerate(weights):
+        if weight:
+            per_level[level[i]] = per_level.get(level[i], 0) + 1
+    width = max(per_level.values(), default=0)
+
+    visiting.discard(tree.session_uid)
+    return _analysis_cache.set(tree, TreeParallelism(tree.name, span, work, width, chain), depends=children)
+
+def highlight_chain(tree, chain):
+    chain = set(chain)
+    for node in tree.nodes:
+        node.select = node.name in chain
+
+class NODEHELPER_OT_analyse_parallelism(Operator):
+    bl_idname = "nodehelper.analyse_parallelism"
+    bl_label = "Analyse Parallelism"
+    bl_description = "Compute the longest serial chain and available parallelism of every geometry node group"
+
+    def execute(self, context):
+        _group_results.clear()
+        for tree in bpy.data.node_groups:
+            if tree.bl_idname == 'GeometryNodeTree':
+                _group_results.append(analyse_tree(tree))
+        _group_results.sort(key=lambda result: result.span, reverse=True)
+        sync_proxy_rows(context.window_manager.nodehelper_parallelism_rows, len(_group_results))
+
+        tree = context.space_data.edit_tree
+        if tree and tree.bl_idname == 'GeometryNodeTree':
+            result = analyse_tree(tree)
+            highlight_chain(tree, result.chain)
+            self.report({'INFO'}, f"{tree.name}: critical path {result.span}, work {result.work}, parallelism {result.parallelism:.1f}x")
+        else:
+            self.report({'INFO'}, f"Analysed {len(_group_results)} node group(s)")
+        return {'FINISHED'}
+
+class NODEHELPER_OT_show_critical_path(Operator):
+    bl_idname = "nodehelper.show_critical_path"
+    bl_label = "Show Critical Path"
+    bl_description = "Open the node group and select its longest serial chain"
+
+    group_name: StringProperty()
+
+    def execute(self, context):
+        tree = bpy.data.node_groups.get(self.group_name)
+        if not tree:
+            self.report({'ERROR'}, f"Node group '{self.group_name}' not found.")
+            return {'CANCELLED'}
+
+        if tree != context.space_data.edit_tree:
+            open_node_path(context, [], root_tree=tree)
+        result = analyse_tree(tree)
+        highlight_chain(tree, result.chain)
+        if result.chain:
+            bpy.ops.node.view_selected('INVOKE_DEFAULT')
+        self.report({'INFO'}, ' > '.join(result.chain) or "No serial chain")
+        return {'FINISHED'}
+
+class NODEHELPER_UL_parallelism(UIList):
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        if index >= len(_group_results):
+            return
+        result = _group_results[index]
+        row = layout.row(align=True)
+        op = row.operator("nodehelper.show_critical_path", text=result.name, icon='NODETREE')
+        op.group_name = result.name
+        row.label(text=f"{result.span} / {result.work} / {result.width} / {result.parallelism:.1f}x")
+
+class NODEHELPER_PT_parallelism(Panel):
+    bl_label = "Parallelism"
+    bl_idname = "NODEHELPER_PT_parallelism"
+    bl_space_type = 'NODE_EDITOR'
+    bl_region_type = 'UI'
+    bl_category = "NodeHelper"
+
+    @classmethod
+    def poll(cls, context):
+        return context.space_data.type == 'NODE_EDITOR' and context.space_data.tree_type == 'GeometryNodeTree'
+
+    def draw(self, context):
+        layout = self.layout
+
+        box = layout.box()
+        row = box.row()
+        row.scale_y = 1.5
+        row.operator("nodehelper.analyse_parallelism", text="Analyse Parallelism", icon='SORTTIME')
+
+        if _group_results:
+            row = box.row()
+            row.label(text="Group")
+            row.label(text="Path / Work / Width / Par.")
+            wm = context.window_manager
+            box.template_list("NODEHELPER_UL_parallelism", "", wm, "nodehelper_parallelism_rows", wm, "nodehelper_active_parallelism_index", rows=5)
+
+def register():
+    bpy.utils.register_class(ParallelismRow)
+    bpy.utils.register_class(NODEHELPER_OT_analyse_parallelism)
+    bpy.utils.register_class(NODEHELPER_OT_show_critical_path)
+    bpy.utils.register_class(NODEHELPER_UL_parallelism)
+    bpy.utils.register_class(NODEHELPER_PT_parallelism)
+    bpy.types.WindowManager.nodehelper_parallelism_rows = CollectionProperty(type=ParallelismRow)
+    bpy.types.WindowManager.nodehelper_active_parallelism_index = IntProperty()
+
+def unregister():
+    _group_results.clear()
+    _analysis_cache.clear()
+    del bpy.types.WindowManager.nodehelper_active_parallelism_index
+    del bpy.types.WindowManager.nodehelper_parallelism_rows
+    bpy.utils.unregister_class(NODEHELPER_PT_parallelism)
+    bpy.utils.unregister_class(NODEHELPER_UL_parallelism)
+    bpy.utils.unregister_class(NODEHELPER_OT_show_critical_path)
+    bpy.utils.unregister_class(NODEHELPER_OT_analyse_parallelism)
+    bpy.utils.unregister_class(ParallelismRow)
@@ -0,0 +1,262 @@
+import bpy
+import heapq
+from bpy.types import Operator, Panel
+from bpy.props import StringProperty
+from .attribute import NAMED_ATTRIBUTE_NODES, get_attribute_name
+from .node_utils import jump_to_tree_node
+from . import tree_cache
+
+MAX_RESULTS = 50
+
+def trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def query_trigrams(query):
+    # The query may start or stop in the middle of a word, so only short queries are padded (prefix match)
+    padded = query if len(query) >= 3 else f"  {query}"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+class FinderEntry:
+    __slots__ = ("kind", "text", "key", "tree_uid", "node_name")
+
+    def __init__(self, kind, text, tree_uid, node_name):
+        self.kind = kind
+        self.text = text
+        self.key = text.lower()
+        self.tree_uid = tree_uid
+        self.node_name = node_name
+
+class TrigramIndex:
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.entries = {}
+        self.postings = {}
+        self.tree_entries = {}
+        self.tree_names = {}
+        self.dirty = set()
+        self.next_id = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def add_entry(self, entry):
+        entry_id = self.next_id
+        self.next_id += 1
+        self.entries[entry_id] = entry
+        for trigram in trigrams(entry.key):
+            self.postings.setdefault(trigram, set()).add(entry_id)
+        return entry_id
+
+    def add_tree(self, tree):
+        uid = tree.session_uid
+        self.remove_tree(uid)
+        self.tree_names[uid] = tree.name
+        ids = [self.add_entry(entry) for entry in collect_tree_entries(tree)]
+        ids.append(self.add_entry(FinderEntry('GROUP', tree.name, uid, None)))
+        self.tree_entries[uid] = ids
+
+    def remove_tree(self, uid):
+        for entry_id in self.tree_entries.pop(uid, ()):
+            entry = self.entries.pop(entry_id)
+            for trigram in trigrams(entry.key):
+                posting = self.postings.get(trigram)
+                if posting is not None:
+                    posting.discard(entry_id)
+                    if not posting:
+                        del self.postings[trigram]
+        self.tree_names.pop(uid, None)
+
+    def sync(self):
+        # Bring the index up to date with bpy.data, rebuilding only new and changed trees
+        trees = {tree.session_uid: tree for tree in bpy.data.node_groups if tree.bl_idname == 'GeometryNodeTree'}
+        for uid in list(self.tree_entries):
+            if uid not in trees:
+                self.remove_tree(uid)
+        for uid, tree in trees.items():
+            if uid not in self.tree_entries or uid in self.dirty or self.tree_names.get(uid) != tree.name:
+                self.add_tree(tree)
+        self.dirty.clear()
+
+    def search(self, query, limit=MAX_RESULTS):
+        query = query.lower().strip()
+        if not query:
+            return []
+        grams = query_trigrams(query)
+        # An entry must share at least half of the query trigrams. By pigeonhole it then appears in
+        # one of the (n - required + 1) rarest postings, so only those are used to produce candidates.
+        required = max(1, (len(grams) + 1) // 2)
+        postings = sorted((self.postings.get(gram, set()) for gram in grams), key=len)
+        seed_count = len(postings) - required + 1
+        candidates = set()
+        for posting in postings[:seed_count]:
+            candidates |= posting
+
+        scored = []
+        for entry_id in candidates:
+            hits = sum(1 for posting in postings if entry_id in posting)
+            if hits < required:
+                continue
+            entry = self.entries[entry_id]
+            score = hits / len(grams)
+            if query in entry.key:
+                score += 1.0
+                if entry.key.startswith(query):
+                    score += 0.5
+                if entry.key == query:
+                    score += 1.0
+            scored.append((score, -len(entry.key), entry_id))
+        return [(entry_id, score) for score, _, entry_id in heapq.nlargest(limit, scored)]
+
+def collect_tree_entries(tree):
+    uid = tree.session_uid
+    for node in tree.nodes:
+        if node.type == 'FRAME':
+            if node.label:
+                yield FinderEntry('FRAME', node.label, uid, node.name)
+            continue
+        yield FinderEntry('NODE', node.name, uid, node.name)
+        if node.label:
+            yield FinderEntry('LABEL', node.label, uid, node.name)
+        if node.type == 'GROUP' and node.node_tree:
+            yield FinderEntry('GROUP', node.node_tree.name, uid, node.name)
+        if node.bl_idname in NAMED_ATTRIBUTE_NODES:
+            attribute_name = get_attribute_name(node)
+            if attribute_name:
+                yield FinderEntry('ATTRIBUTE', attribute_name, uid, node.name)
+
+    group_input = next((node for node in tree.nodes if node.type == 'GROUP_INPUT'), None)
+    for item in tree.interface.items_tree:
+        if item.item_type == 'SOCKET' and item.name:
+            target = group_input.name if group_input and item.in_out == 'INPUT' else None
+            yield FinderEntry('SOCKET', item.name, uid, target)
+
+_index = TrigramIndex()
+_last_results = {}
+
+def _on_trees_changed(changed):
+    if changed is None:
+        _index.clear()
+    else:
+        _index.dirty |= changed & set(_index.tree_entries)
+
+def describe_entry(entry):
+    tree_name = _index.tree_names.get(entry.tree_uid, "?")
+    location = f"{tree_name} > {entry.node_name}" if entry.node_name else tree_name
+    return f"{entry.text}  ({entry.kind.title()} in {location})"
+
+def run_search(query, limit=MAX_RESULTS):
+    _index.sync()
+    return [_index.entries[entry_id] for entry_id, _ in _index.search(query, limit)]
+
+def _search_query(self, context, edit_text):
+    _last_results.clear()
+    for entry in run_search(edit_text):
+        _last_results[describe_entry(entry)] = entry
+    return list(_last_results)
+
+def jump_to_entry(context, entry):
+    target_tree = next((tree for tree in bpy.data.node_groups if tree.session_uid == entry.tree_uid), None)
+    if not target_tree:
+        return "Node group no longer exists."
+
+    return jump_to_tree_node(context, target_tree, entry.node_name)
+
+class NODEHELPER_OT_find_anything(Operator):
+    bl_idname = "nodehelper.find_anything"
+    bl_label = "Go to Anything"
+    bl_description = "Search node names, labels, groups, sockets, frames and attributes in every geometry node group"
+    bl_property = "query"
+
+    query: StringProperty(name="Find", search=_search_query, search_options=set())
+
+    @classmethod
+    def poll(cls, context):
+        return context.space_data.type == 'NODE_EDITOR' and context.space_data.tree_type == 'GeometryNodeTree'
+
+    def invoke(self, context, event):
+        _index.sync()
+        self.query = ""
+        return context.window_manager.invoke_props_dialog(self)
+
+    def draw(self, context):
+        self.layout.prop(self, "query", text="", icon='VIEWZOOM')
+
+    def execute(self, context):
+        entry = _last_results.get(self.query)
+        if entry is None:
+            # Free text: go to the best match
+            results = run_search(self.query, limit=1)
+            entry = results[0] if results else None
+        if entry is None:
+            self.report({'WARNING'}, f"Nothing found for '{self.query}'")
+            return {'CANCELLED'}
+
+        error = jump_to_entry(context, entry)
+        if error:
+            self.report({'ERROR'}, error)
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Jumped to {describe_entry(entry)}")
+        return {'FINISHED'}
+
+class NODEHELPER_OT_rebuild_finder_index(Operator):
+    bl_idname = "nodehelper.rebuild_finder_index"
+    bl_label = "Rebuild Index"
+    bl_description = "Rebuild the search index for every geometry node group"
+
+    def execute(self, context):
+        _index.clear()
+        _index.sync()
+        self.report({'INFO'}, f"Indexed {len(_index)} item(s) in {len(_index.tree_entries)} group(s)")
+        return {'FINISHED'}
+
+class NODEHELPER_PT_finder(Panel):
+    bl_label = "Find Anything"
+    bl_idname = "NODEHELPER_PT_finder"
+    bl_space_type = 'NODE_EDITOR'
+    bl_region_type = 'UI'
+    bl_category = "NodeHelper"
+
+    @classmethod
+    def poll(cls, context):
+        return context.space_data.type == 'NODE_EDITOR' and context.space_data.tree_type == 'GeometryNodeTree'
+
+    def draw(self, context):
+        layout = self.layout
+
+        box = layout.box()
+        row = box.row()
+        row.scale_y = 1.5
+        row.operator("nodehelper.find_anything", text="Go to Anything", icon='VIEWZOOM')
+
+        row = box.row()
+        row.label(text=f"{len(_index)} indexed item(s)")
+        row.operator("nodehelper.rebuild_finder_index", text="", icon='FILE_REFRESH')
+
+addon_keymaps = []
+
+def register():
+    bpy.utils.register_class(NODEHELPER_OT_find_anything)
+    bpy.utils.register_class(NODEHELPER_OT_rebuild_finder_index)
+    bpy.utils.register_class(NODEHELPER_PT_finder)
+    tree_cache.add_change_listener(_on_trees_changed)
+
+    keyconfig = bpy.context.window_manager.keyconfigs.addon
+    if keyconfig:
+        keymap = keyconfig.keymaps.new(name="Node Editor", space_type='NODE_EDITOR')
+        keymap_item = keymap.keymap_items.new("nodehelper.find_anything", type='F', value='PRESS', ctrl=True, shift=True)
+        addon_keymaps.append((keymap, keymap_item))
+
+def unregister():
+    for keymap, keymap_item in addon_keymaps:
+        keymap.keymap_items.remove(keymap_item)
+    addon_keymaps.clear()
+
+    tree_cache.remove_change_listener(_on_trees_changed)
+    _index.clear()
+    _last_results.clear()
+    bpy.utils.unregister_class(NODEHELPER_PT_finder)
+    bpy.utils.unregister_class(NODEHELPER_OT_rebuild_finder_index)
+    bpy.utils.unregister_class(NODEHELPER_OT_find_anything)
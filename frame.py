@@ -1,5 +1,63 @@
 import bpy
-from bpy.types import Panel, Operator
+from fnmatch import fnmatchcase
+from bpy.types import Panel, Operator, PropertyGroup, UIList
+from bpy.props import StringProperty, IntProperty, BoolProperty, FloatVectorProperty, CollectionProperty, EnumProperty
+from .batch import batch_updates, tag_tree_update, tag_redraw
+from . import tree_cache
+
+DARK_FRAME_COLOR = (0.3, 0.3, 0.3)
+
+# Frame node names per tree, dropped whenever the tree changes
+_frame_index = tree_cache.TreeCache()
+
+class FrameStylePreset(PropertyGroup):
+    name: StringProperty(default="Preset")
+    color: FloatVectorProperty(subtype='COLOR', size=3, min=0.0, max=1.0, default=DARK_FRAME_COLOR)
+    label_size: IntProperty(min=8, max=64, default=20)
+    shrink: BoolProperty(default=True)
+
+def get_frames(tree):
+    # Frame nodes of a tree from the index; names are stored, never node references,
+    # so a stale entry (frame removed or renamed) only triggers a rescan
+    cached = _frame_index.get(tree)
+    if cached is not None and cached[0] == len(tree.nodes):
+        frames = [tree.nodes.get(name) for name in cached[1]]
+        if all(frame is not None and frame.type == 'FRAME' for frame in frames):
+            return frames
+    frames = [node for node in tree.nodes if node.type == 'FRAME']
+    _frame_index.set(tree, (len(tree.nodes), [frame.name for frame in frames]))
+    return frames
+
+def frame_matches_pattern(frame, pattern):
+    return fnmatchcase((frame.label or frame.name).lower(), pattern.lower())
+
+def apply_frame_style(frame, color=None, label_size=None, shrink=None):
+    # Only write what differs, returns True when the frame changed
+    changed = False
+    if color is not None and (not frame.use_custom_color or any(abs(a - b) > 1e-6 for a, b in zip(frame.color, color))):
+        frame.use_custom_color = True
+        frame.color = color
+        changed = True
+    if label_size is not None and frame.label_size != label_size:
+        frame.label_size = label_size
+        changed = True
+    if shrink is not None and frame.shrink != shrink:
+        frame.shrink = shrink
+        changed = True
+    return changed
+
+def selected_frames(context):
+    space = context.space_data
+    active_tree = space.edit_tree or space.node_tree
+    if not active_tree:
+        return None, []
+    return active_tree, [frame for frame in get_frames(active_tree) if frame.select]
+
+def ensure_default_preset(scene):
+    if not scene.nodehelper_frame_presets:
+        preset = scene.nodehelper_frame_presets.add()
+        preset.name = "Dark"
+        scene.nodehelper_active_frame_preset = 0
 
 class NODEHELPER_OT_set_frame_color(Operator):
     bl_idname = "nodehelper.set_frame_color"
@@ -8,15 +66,11 @@ class NODEHELPER_OT_set_frame_color(Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        space = context.space_data
-        active_tree = space.edit_tree or space.node_tree
-        
-        if active_tree:
-            for node in active_tree.nodes:
-                if node.select and node.type == 'FRAME':
-                    node.use_custom_color = True
-                    node.color = (0.3, 0.3, 0.3)
-        
+        active_tree, frames = selected_frames(context)
+        with batch_updates(context):
+            if any([apply_frame_style(frame, color=DARK_FRAME_COLOR) for frame in frames]):
+                tag_tree_update(active_tree)
+
         return {'FINISHED'}
 
 class NODEHELPER_OT_increase_label_size(Operator):
@@ -26,16 +80,115 @@ class NODEHELPER_OT_increase_label_size(Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        space = context.space_data
-        active_tree = space.edit_tree or space.node_tree
-        
-        if active_tree:
-            for node in active_tree.nodes:
-                if node.select and node.type == 'FRAME':
-                    node.label_size += 10
-        
+        active_tree, frames = selected_frames(context)
+        with batch_updates(context):
+            if any([apply_frame_style(frame, label_size=min(frame.label_size + 10, 64)) for frame in frames]):
+                tag_tree_update(active_tree)
+
         return {'FINISHED'}
 
+class NODEHELPER_OT_add_frame_preset(Operator):
+    bl_idname = "nodehelper.add_frame_preset"
+    bl_label = "Add Frame Preset"
+    bl_description = "Add a frame style preset, taken from the active frame when one is selected"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        scene = context.scene
+        ensure_default_preset(scene)
+        preset = scene.nodehelper_frame_presets.add()
+        preset.name = "Preset"
+
+        tree = context.space_data.edit_tree
+        active = tree.nodes.active if tree else None
+        if active and active.type == 'FRAME' and active.select:
+            preset.name = active.label or active.name
+            if active.use_custom_color:
+                preset.color = active.color
+            preset.label_size = active.label_size
+            preset.shrink = active.shrink
+
+        scene.nodehelper_active_frame_preset = len(scene.nodehelper_frame_presets) - 1
+        return {'FINISHED'}
+
+class NODEHELPER_OT_remove_frame_preset(Operator):
+    bl_idname = "nodehelper.remove_frame_preset"
+    bl_label = "Remove Frame Preset"
+    bl_description = "Remove the active frame style preset"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return len(context.scene.nodehelper_frame_presets) > 0
+
+    def execute(self, context):
+        scene = context.scene
+        scene.nodehelper_frame_presets.remove(scene.nodehelper_active_frame_preset)
+        scene.nodehelper_active_frame_preset = max(0, min(scene.nodehelper_active_frame_preset, len(scene.nodehelper_frame_presets) - 1))
+        return {'FINISHED'}
+
+class NODEHELPER_OT_apply_frame_preset(Operator):
+    bl_idname = "nodehelper.apply_frame_preset"
+    bl_label = "Apply Frame Preset"
+    bl_description = "Apply the active frame style preset to the chosen frames in one undo step"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    target: EnumProperty(
+        name="Frames",
+        items=[
+            ('SELECTED', "Selected", "Selected frames in the edited tree"),
+            ('PATTERN', "Label Pattern", "Frames whose label matches the pattern, in every geometry node group"),
+            ('ALL', "All", "Every frame in every geometry node group"),
+        ],
+        default='SELECTED'
+    )
+
+    def execute(self, context):
+        scene = context.scene
+        ensure_default_preset(scene)
+        if not 0 <= scene.nodehelper_active_frame_preset < len(scene.nodehelper_frame_presets):
+            self.report({'ERROR'}, "No frame preset selected.")
+            return {'CANCELLED'}
+        preset = scene.nodehelper_frame_presets[scene.nodehelper_active_frame_preset]
+        color = tuple(preset.color)
+
+        if self.target == 'SELECTED':
+            active_tree, frames = selected_frames(context)
+            targets = [(active_tree, frames)] if active_tree else []
+        else:
+            pattern = scene.nodehelper_frame_pattern if self.target == 'PATTERN' else None
+            if self.target == 'PATTERN' and not pattern:
+                self.report({'ERROR'}, "Enter a label pattern first.")
+                return {'CANCELLED'}
+            targets = []
+            for tree in bpy.data.node_groups:
+                if tree.bl_idname != 'GeometryNodeTree' or tree.library:
+                    continue
+                frames = get_frames(tree)
+                if pattern:
+                    frames = [frame for frame in frames if frame_matches_pattern(frame, pattern)]
+                targets.append((tree, frames))
+
+        changed_frames = 0
+        changed_trees = 0
+        with batch_updates(context):
+            for tree, frames in targets:
+                changed = sum(apply_frame_style(frame, color, preset.label_size, preset.shrink) for frame in frames)
+                if changed:
+                    changed_frames += changed
+                    changed_trees += 1
+                    tag_tree_update(tree)
+            tag_redraw(context)
+
+        self.report({'INFO'}, f"Applied '{preset.name}' to {changed_frames} frame(s) in {changed_trees} group(s)")
+        return {'FINISHED'}
+
+class NODEHELPER_UL_frame_presets(UIList):
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        row = layout.row(align=True)
+        row.prop(item, "color", text="")
+        row.prop(item, "name", text="", emboss=False)
+
 class NODEHELPER_PT_frame(Panel):
     bl_label = "Frame"
     bl_idname = "NODEHELPER_PT_frame"
@@ -49,29 +202,75 @@ class NODEHELPER_PT_frame(Panel):
 
     def draw(self, context):
         layout = self.layout
-        
+        scene = context.scene
+
         # Frame Operations
         box = layout.box()
         box.label(text="Frame Operations")
-        
+
         # Make the buttons 1.5 times bigger
         row = box.row()
         row.scale_y = 1.5
         row.operator("nodehelper.increase_label_size", text="Bigger Label Size")
-        
+
         row = box.row()
         row.scale_y = 1.5
         row.operator("nodehelper.set_frame_color", text="Set Dark Frame Color")
 
+        # Style Presets
+        box = layout.box()
+        box.label(text="Style Presets")
+        row = box.row()
+        row.template_list("NODEHELPER_UL_frame_presets", "", scene, "nodehelper_frame_presets", scene, "nodehelper_active_frame_preset", rows=3)
+        col = row.column(align=True)
+        col.operator("nodehelper.add_frame_preset", text="", icon='ADD')
+        col.operator("nodehelper.remove_frame_preset", text="", icon='REMOVE')
+
+        if 0 <= scene.nodehelper_active_frame_preset < len(scene.nodehelper_frame_presets):
+            preset = scene.nodehelper_frame_presets[scene.nodehelper_active_frame_preset]
+            col = box.column(align=True)
+            col.prop(preset, "color", text="Color")
+            col.prop(preset, "label_size", text="Label Size")
+            col.prop(preset, "shrink", text="Shrink")
+
+        row = box.row()
+        row.scale_y = 1.5
+        row.operator("nodehelper.apply_frame_preset", text="Apply to Selected").target = 'SELECTED'
+        row = box.row(align=True)
+        row.prop(scene, "nodehelper_frame_pattern", text="", icon='VIEWZOOM')
+        row.operator("nodehelper.apply_frame_preset", text="Apply to Matching").target = 'PATTERN'
+        box.operator("nodehelper.apply_frame_preset", text="Apply to All Groups", icon='NODETREE').target = 'ALL'
+
 def register():
+    bpy.utils.register_class(FrameStylePreset)
     bpy.utils.register_class(NODEHELPER_OT_set_frame_color)
     bpy.utils.register_class(NODEHELPER_OT_increase_label_size)
+    bpy.utils.register_class(NODEHELPER_OT_add_frame_preset)
+    bpy.utils.register_class(NODEHELPER_OT_remove_frame_preset)
+    bpy.utils.register_class(NODEHELPER_OT_apply_frame_preset)
+    bpy.utils.register_class(NODEHELPER_UL_frame_presets)
     bpy.utils.register_class(NODEHELPER_PT_frame)
+    bpy.types.Scene.nodehelper_frame_presets = CollectionProperty(type=FrameStylePreset)
+    bpy.types.Scene.nodehelper_active_frame_preset = IntProperty(default=0)
+    bpy.types.Scene.nodehelper_frame_pattern = StringProperty(
+        name="Frame Label Pattern",
+        description="Frames whose label (or name) matches this pattern, supports * and ? wildcards",
+        default=""
+    )
 
 def unregister():
+    del bpy.types.Scene.nodehelper_frame_pattern
+    del bpy.types.Scene.nodehelper_active_frame_preset
+    del bpy.types.Scene.nodehelper_frame_presets
+    _frame_index.clear()
     bpy.utils.unregister_class(NODEHELPER_PT_frame)
+    bpy.utils.unregister_class(NODEHELPER_UL_frame_presets)
+    bpy.utils.unregister_class(NODEHELPER_OT_apply_frame_preset)
+    bpy.utils.unregister_class(NODEHELPER_OT_remove_frame_preset)
+    bpy.utils.unregister_class(NODEHELPER_OT_add_frame_preset)
     bpy.utils.unregister_class(NODEHELPER_OT_increase_label_size)
     bpy.utils.unregister_class(NODEHELPER_OT_set_frame_color)
+    bpy.utils.unregister_class(FrameStylePreset)
 
 if __name__ == "__main__":
-    register() 
\ No newline at end of file
+    register()
@@ -1,6 +1,11 @@
 import bpy
-from bpy.types import Panel, Operator, PropertyGroup
-from bpy.props import StringProperty, IntProperty, BoolProperty, CollectionProperty
+import numpy as np
+from fnmatch import fnmatchcase
+from bpy.types import Panel, Operator, PropertyGroup, UIList
+from bpy.props import StringProperty, IntProperty, BoolProperty, CollectionProperty, EnumProperty
+from .batch import batch_updates, tag_tree_update, tag_view_layer_update
+from .snapshot import TreeSnapshot
+from . import tree_cache
 
 # Property Groups for Copy/Paste functionality
 class CopiedInputProperty(PropertyGroup):
@@ -12,6 +17,34 @@ class CopiedInput(PropertyGroup):
     type: StringProperty()
     properties: CollectionProperty(type=CopiedInputProperty)
 
+# Group Input analysis, shared by the operators and the command line audit.
+# The per-click helpers walk tree.links once instead of building a full TreeSnapshot.
+def find_unused_group_input_sockets(tree):
+    linked = {link.from_socket.as_pointer() for link in tree.links if link.from_node.type == 'GROUP_INPUT'}
+    return [output for node in tree.nodes if node.type == 'GROUP_INPUT'
+            for output in node.outputs if output.as_pointer() not in linked]
+
+def find_nodes_using_input(tree, input_name):
+    users = {link.to_node.name for link in tree.links
+             if link.from_node.type == 'GROUP_INPUT' and link.from_socket.name == input_name and link.to_node.type != 'GROUP_INPUT'}
+    return [node for node in tree.nodes if node.name in users]
+
+def find_group_input_users(tree):
+    users = {}
+    for item in tree.interface.items_tree:
+        if item.item_type == 'SOCKET' and item.in_out == 'INPUT':
+            users[item.name] = []
+    snapshot = TreeSnapshot(tree)
+    from_input = snapshot.group_input_output_mask()[snapshot.link_from_socket]
+    for link_index in np.flatnonzero(from_input):
+        name = snapshot.socket_names[snapshot.link_from_socket[link_index]]
+        node_index = snapshot.link_to_node[link_index]
+        if name in users and snapshot.node_types[node_index] != 'GROUP_INPUT':
+            node_name = snapshot.nodes[node_index].name
+            if node_name not in users[name]:
+                users[name].append(node_name)
+    return users
+
 # Operators for Group Input Management
 class NODEHELPER_OT_hide_unused_sockets(Operator):
     bl_idname = "nodehelper.hide_unused_sockets"
@@ -24,11 +57,8 @@ class NODEHELPER_OT_hide_unused_sockets(Operator):
         active_tree = space.edit_tree or space.node_tree
         
         if active_tree:
-            for node in active_tree.nodes:
-                if node.type == 'GROUP_INPUT':
-                    for output in node.outputs:
-                        if not output.links:
-                            output.hide = True
+            for output in find_unused_group_input_sockets(active_tree):
+                output.hide = True
         return {'FINISHED'}
 
 class NODEHELPER_OT_drag_input(Operator):
@@ -85,17 +115,7 @@ class NODEHELPER_OT_jump_to_connected_node(Operator):
     input_name: StringProperty()
 
     def find_nodes_using_input(self, tree, input_name):
-        nodes = []
-        for node in tree.nodes:
-            if node.type == 'GROUP_INPUT':
-                continue
-            for input_socket in node.inputs:
-                if input_socket.links:
-                    from_socket = input_socket.links[0].from_socket
-                    if from_socket.node.type == 'GROUP_INPUT' and from_socket.name == input_name:
-                        nodes.append(node)
-                        break
-        return nodes
+        return find_nodes_using_input(tree, input_name)
 
     def execute(self, context):
         active_tree = context.space_data.edit_tree
@@ -124,6 +144,157 @@ class NODEHELPER_OT_jump_to_connected_node(Operator):
         self.report({'INFO'}, f"Jumped to node {next_index + 1}/{len(connected_nodes)} using input: {self.input_name}")
         return {'FINISHED'}
 
+# Interface socket list helpers
+def socket_matches_filter(name, pattern):
+    if not pattern:
+        return True
+    return fnmatchcase(name.lower(), f"*{pattern.lower()}*")
+
+def interface_item_depth(item):
+    depth = 0
+    parent = item.parent
+    while parent is not None and parent.parent is not None:
+        depth += 1
+        parent = parent.parent
+    return depth
+
+def interface_panel_path(item):
+    path = []
+    parent = item.parent
+    while parent is not None and parent.parent is not None:
+        path.append(parent.name)
+        parent = parent.parent
+    return tuple(reversed(path))
+
+# Filter/sort results per tree, dropped by the tree_cache handlers whenever the tree (and so its interface) changes
+_socket_list_cache = tree_cache.TreeCache()
+
+class NODEHELPER_UL_interface_sockets(UIList):
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        if self.layout_type in {'DEFAULT', 'COMPACT'}:
+            row = layout.row(align=True)
+            for _ in range(interface_item_depth(item)):
+                row.separator(factor=1.5)
+            if item.item_type == 'PANEL':
+                row.label(text=item.name, icon='DOWNARROW_HLT')
+            else:
+                row.prop(item, "nodehelper_is_selected", text="")
+                row.label(text=item.name, icon='IMPORT' if item.in_out == 'INPUT' else 'EXPORT')
+        elif self.layout_type in {'GRID'}:
+            layout.alignment = 'CENTER'
+            layout.label(text="", icon='NODE_SOCKET_GEOMETRY')
+
+    def draw_filter(self, context, layout):
+        row = layout.row(align=True)
+        row.prop(self, "use_filter_sort_alpha", text="", icon='SORTALPHA')
+        row.prop(self, "use_filter_sort_reverse", text="", icon='SORT_DESC' if self.use_filter_sort_reverse else 'SORT_ASC')
+
+    def filter_items(self, context, data, propname):
+        items = getattr(data, propname)
+        pattern = context.scene.nodehelper_socket_filter
+
+        # Cheap key only, a cache hit must not touch the interface items
+        key = (len(items), pattern, self.use_filter_sort_alpha, self.use_filter_sort_reverse)
+        cached = _socket_list_cache.get(data.id_data)
+        if cached and cached[0] == key:
+            return cached[1], cached[2]
+
+        # One pass over RNA, everything below works on plain tuples
+        entries = [(item.item_type, item.name, interface_panel_path(item)) for item in items]
+
+        flags = [0] * len(entries)
+        visible_panels = set()
+        for i, (item_type, name, panel_path) in enumerate(entries):
+            if item_type == 'SOCKET' and socket_matches_filter(name, pattern):
+                flags[i] = self.bitflag_filter_item
+                # Keep every enclosing panel visible so rows stay grouped
+                for depth in range(1, len(panel_path) + 1):
+                    visible_panels.add(panel_path[:depth])
+        for i, (item_type, name, panel_path) in enumerate(entries):
+            if item_type == 'PANEL' and panel_path + (name,) in visible_panels:
+                flags[i] = self.bitflag_filter_item
+
+        order = []
+        if self.use_filter_sort_alpha:
+            groups = {}
+            for i, (item_type, name, panel_path) in enumerate(entries):
+                if item_type == 'PANEL':
+                    groups.setdefault(panel_path + (name,), [])
+                    groups.setdefault(panel_path, []).append((0, name.lower(), i))
+                else:
+                    groups.setdefault(panel_path, []).append((1, name.lower(), i))
+            sorted_indices = []
+            def append_group(panel_path):
+                members = sorted(groups.get(panel_path, ()), key=lambda m: (m[0], m[1]), reverse=self.use_filter_sort_reverse)
+                sockets = [m for m in members if m[0] == 1]
+                panels = [m for m in members if m[0] == 0]
+                for _, _, i in sockets:
+                    sorted_indices.append(i)
+                for _, _, i in panels:
+                    sorted_indices.append(i)
+                    append_group(panel_path + (entries[i][1],))
+            append_group(())
+            order = [0] * len(entries)
+            for new_index, i in enumerate(sorted_indices):
+                order[i] = new_index
+
+        _socket_list_cache.set(data.id_data, (key, flags, order))
+        return flags, order
+
+class NODEHELPER_OT_select_interface_sockets(Operator):
+    bl_idname = "nodehelper.select_interface_sockets"
+    bl_label = "Select Interface Sockets"
+    bl_description = "Change the Copy & Paste selection of interface sockets"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    action: EnumProperty(
+        items=[
+            ('MATCHING', "Select Matching", "Select all sockets matching the filter"),
+            ('TYPE', "Select Same Type", "Select all sockets matching the filter with the type of the active socket"),
+            ('NONE', "Deselect All", "Deselect all sockets"),
+            ('INVERT', "Invert", "Invert the selection of sockets matching the filter"),
+        ],
+        default='MATCHING'
+    )
+
+    def execute(self, context):
+        tree = context.space_data.edit_tree
+        if not tree or tree.type != 'GEOMETRY':
+            self.report({'ERROR'}, "No active Geometry Node group")
+            return {'CANCELLED'}
+
+        items = tree.interface.items_tree
+        pattern = context.scene.nodehelper_socket_filter
+        socket_type = None
+        if self.action == 'TYPE':
+            index = context.scene.nodehelper_active_socket_index
+            active = items[index] if 0 <= index < len(items) else None
+            if not active or active.item_type != 'SOCKET':
+                self.report({'WARNING'}, "No active socket")
+                return {'CANCELLED'}
+            socket_type = active.socket_type
+
+        changed = 0
+        for item in items:
+            if item.item_type != 'SOCKET':
+                continue
+            if self.action == 'NONE':
+                selected = False
+            elif not socket_matches_filter(item.name, pattern):
+                continue
+            elif self.action == 'INVERT':
+                selected = not item.nodehelper_is_selected
+            elif self.action == 'TYPE':
+                selected = item.socket_type == socket_type
+            else:
+                selected = True
+            if item.nodehelper_is_selected != selected:
+                item.nodehelper_is_selected = selected
+                changed += 1
+
+        self.report({'INFO'}, f"Changed selection of {changed} socket(s)")
+        return {'FINISHED'}
+
 # Copy/Paste Operators
 class NODEHELPER_OT_copy_selected_group_inputs(Operator):
     bl_idname = "nodehelper.copy_selected_group_inputs"
@@ -135,8 +306,9 @@ class NODEHELPER_OT_copy_selected_group_inputs(Operator):
             self.report({'ERROR'}, "No active Geometry Node group")
             return {'CANCELLED'}
         
-        node_tree.update_tag()
-        context.view_layer.update()
+        with batch_updates(context):
+            tag_tree_update(node_tree)
+            tag_view_layer_update(context)
         
         context.scene.copied_group_inputs.clear()
         
@@ -195,8 +367,17 @@ class NODEHELPER_OT_paste_group_inputs(Operator):
         if not node_tree.is_embedded_data:
             node_tree.use_fake_user = True
 
-        updated_count = 0
-        created_count = 0
+        with batch_updates(context):
+            self.paste_inputs(context, node_tree)
+            tag_tree_update(node_tree)
+            tag_view_layer_update(context)
+        
+        self.report({'INFO'}, f"Updated {self.updated_count} existing inputs and created {self.created_count} new inputs")
+        return {'FINISHED'}
+
+    def paste_inputs(self, context, node_tree):
+        self.updated_count = 0
+        self.created_count = 0
         for input_data in context.scene.copied_group_inputs:
             existing_socket = next((s for s in node_tree.interface.items_tree if s.name == input_data.name), None)
             
@@ -206,47 +387,49 @@ class NODEHELPER_OT_paste_group_inputs(Operator):
             try:
                 if existing_socket:
                     socket = existing_socket
-                    updated_count += 1
+                    self.updated_count += 1
                 else:
                     socket = node_tree.interface.new_socket(
                         name=input_data.name,
                         in_out='INPUT',
                         socket_type=input_data.type
                     )
-                    created_count += 1
+                    self.created_count += 1
                 
                 for prop in input_data.properties:
                     if hasattr(socket, prop.name) and prop.name not in ['is_modifier', 'is_tool']:
                         try:
                             value = getattr(socket, prop.name)
                             if isinstance(value, bool):
-                                setattr(socket, prop.name, prop.value.lower() == 'true')
+                                new_value = prop.value.lower() == 'true'
                             elif isinstance(value, int):
-                                setattr(socket, prop.name, int(float(prop.value)))
+                                new_value = int(float(prop.value))
                             elif isinstance(value, float):
-                                setattr(socket, prop.name, float(prop.value))
+                                new_value = float(prop.value)
                             elif isinstance(value, (tuple, list)):
-                                setattr(socket, prop.name, tuple(map(float, prop.value.split(','))))
+                                new_value = tuple(map(float, prop.value.split(',')))
+                                value = tuple(value)
                             else:
-                                setattr(socket, prop.name, prop.value)
+                                new_value = prop.value
+                            # Skip writes that would not change anything, each one triggers an RNA update
+                            if value != new_value:
+                                setattr(socket, prop.name, new_value)
                         except Exception as e:
                             self.report({'WARNING'}, f"Failed to set property {prop.name}: {str(e)}")
                 
                 if is_modifier_prop and hasattr(node_tree, 'is_modifier'):
-                    node_tree.is_modifier = is_modifier_prop.value.lower() == 'true'
+                    is_modifier = is_modifier_prop.value.lower() == 'true'
+                    if node_tree.is_modifier != is_modifier:
+                        node_tree.is_modifier = is_modifier
 
                 if is_tool_prop and hasattr(node_tree, 'is_tool'):
-                    node_tree.is_tool = is_tool_prop.value.lower() == 'true'
+                    is_tool = is_tool_prop.value.lower() == 'true'
+                    if node_tree.is_tool != is_tool:
+                        node_tree.is_tool = is_tool
 
             except Exception as e:
                 self.report({'ERROR'}, f"Failed to process socket {input_data.name}: {str(e)}")
 
-        node_tree.update_tag()
-        context.view_layer.update()
-        
-        self.report({'INFO'}, f"Updated {updated_count} existing inputs and created {created_count} new inputs")
-        return {'FINISHED'}
-
 # Panel Classes
 class NODEHELPER_PT_group_input(Panel):
     bl_label = "Group Input"
@@ -309,10 +492,14 @@ class NODEHELPER_PT_group_input(Panel):
             box = layout.box()
             box.label(text="Copy & Paste")
             
-            for socket in tree.interface.items_tree:
-                if socket.item_type == 'SOCKET':
-                    row = box.row()
-                    row.prop(socket, "nodehelper_is_selected", text=socket.name)
+            box.prop(context.scene, "nodehelper_socket_filter", text="", icon='VIEWZOOM')
+            box.template_list("NODEHELPER_UL_interface_sockets", "", tree.interface, "items_tree", context.scene, "nodehelper_active_socket_index", rows=8)
+            
+            row = box.row(align=True)
+            row.operator("nodehelper.select_interface_sockets", text="All").action = 'MATCHING'
+            row.operator("nodehelper.select_interface_sockets", text="Same Type").action = 'TYPE'
+            row.operator("nodehelper.select_interface_sockets", text="Invert").action = 'INVERT'
+            row.operator("nodehelper.select_interface_sockets", text="None").action = 'NONE'
             
             row = box.row(align=True)
             row.operator("nodehelper.copy_selected_group_inputs", text="Copy Selected")
@@ -324,6 +511,8 @@ def register():
     bpy.utils.register_class(NODEHELPER_OT_hide_unused_sockets)
     bpy.utils.register_class(NODEHELPER_OT_jump_to_connected_node)
     bpy.utils.register_class(NODEHELPER_OT_drag_input)
+    bpy.utils.register_class(NODEHELPER_UL_interface_sockets)
+    bpy.utils.register_class(NODEHELPER_OT_select_interface_sockets)
     bpy.utils.register_class(NODEHELPER_OT_copy_selected_group_inputs)
     bpy.utils.register_class(NODEHELPER_OT_paste_group_inputs)
     bpy.utils.register_class(NODEHELPER_PT_group_input)
@@ -338,6 +527,12 @@ def register():
         default=0,
         min=0
     )
+    bpy.types.Scene.nodehelper_socket_filter = StringProperty(
+        name="Socket Filter",
+        description="Only list interface sockets whose name contains this text (supports * and ? wildcards)",
+        default=""
+    )
+    bpy.types.Scene.nodehelper_active_socket_index = IntProperty(default=0)
     bpy.types.NodeTreeInterfaceSocket.nodehelper_is_selected = BoolProperty(default=False)
     bpy.types.Scene.copied_group_inputs = CollectionProperty(type=CopiedInput)
 
@@ -345,6 +540,8 @@ def unregister():
     bpy.utils.unregister_class(NODEHELPER_PT_group_input)
     bpy.utils.unregister_class(NODEHELPER_OT_paste_group_inputs)
     bpy.utils.unregister_class(NODEHELPER_OT_copy_selected_group_inputs)
+    bpy.utils.unregister_class(NODEHELPER_OT_select_interface_sockets)
+    bpy.utils.unregister_class(NODEHELPER_UL_interface_sockets)
     bpy.utils.unregister_class(NODEHELPER_OT_drag_input)
     bpy.utils.unregister_class(NODEHELPER_OT_jump_to_connected_node)
     bpy.utils.unregister_class(NODEHELPER_OT_hide_unused_sockets)
@@ -353,8 +550,11 @@ def unregister():
     
     del bpy.types.Scene.nodehelper_input_search
     del bpy.types.Scene.nodehelper_current_node_index
+    del bpy.types.Scene.nodehelper_socket_filter
+    del bpy.types.Scene.nodehelper_active_socket_index
     del bpy.types.NodeTreeInterfaceSocket.nodehelper_is_selected
     del bpy.types.Scene.copied_group_inputs
+    _socket_list_cache.clear()
 
 if __name__ == "__main__":
     register()
\ No newline at end of file
@@ -0,0 +1,325 @@
+import bpy
+import hashlib
+import json
+import os
+import subprocess
+from bpy.types import Operator, Panel, PropertyGroup, UIList
+from bpy.props import StringProperty, IntProperty, CollectionProperty
+from .node_utils import open_node_path, sync_proxy_rows
+from .cli import LINE_PREFIX, PYTHON_EXIT_CODE
+from . import tree_cache
+
+# Per-tree content hashes, dropped when the tree or any group nested in it changes
+_hash_cache = tree_cache.TreeCache()
+_node_property_names = {}
+_base_node_properties = None
+
+def _new_hash():
+    return hashlib.blake2b(digest_size=16)
+
+def _value_token(value):
+    if isinstance(value, (bool, int, float, str)) or value is None:
+        return value
+    if isinstance(value, bpy.types.ID):
+        return ("ID", type(value).__name__, value.name)
+    if isinstance(value, bpy.types.bpy_struct):
+        # Other pointers (paired_output, active_item, ...) by name only, their repr embeds the tree name
+        return ("STRUCT", type(value).__name__, getattr(value, "name", None) or getattr(value, "identifier", None))
+    if isinstance(value, bpy.types.bpy_prop_collection):
+        return tuple((getattr(item, "name", ""), getattr(item, "socket_type", getattr(item, "data_type", ""))) for item in value)
+    try:
+        return tuple(_value_token(v) for v in value)
+    except TypeError:
+        return repr(value)
+
+def _property_names(node):
+    # Node type specific settings (operation, data_type, domain, ...), looked up once per node type
+    global _base_node_properties
+    names = _node_property_names.get(node.bl_idname)
+    if names is None:
+        if _base_node_properties is None:
+            _base_node_properties = {prop.identifier for prop in bpy.types.Node.bl_rna.properties}
+        names = tuple(sorted(
+            prop.identifier for prop in node.bl_rna.properties
+            if prop.identifier not in _base_node_properties and prop.identifier != "node_tree"
+        ))
+        _node_property_names[node.bl_idname] = names
+    return names
+
+def _socket_tokens(sockets):
+    tokens = []
+    for socket in sockets:
+        value = None
+        if not socket.is_linked and hasattr(socket, "default_value"):
+            value = _value_token(socket.default_value)
+        tokens.append((socket.identifier, socket.enabled, value))
+    return tokens
+
+def node_digest(node, group_digest=None):
+    tokens = [node.bl_idname, node.name, node.label, node.mute, node.parent.name if node.parent else None]
+    for identifier in _property_names(node):
+        try:
+            tokens.append((identifier, _value_token(getattr(node, identifier))))
+        except AttributeError:
+            pass
+    tokens.append(_socket_tokens(node.inputs))
+    tokens.append(group_digest)
+    digest = _new_hash()
+    digest.update(repr(tokens).encode())
+    return digest.hexdigest()
+
+def link_key(link):
+    return (link.from_node.name, link.from_socket.identifier, link.to_node.name, link.to_socket.identifier, link.is_muted)
+
+def interface_digest(tree):
+    tokens = []
+    for item in tree.interface.items_tree:
+        if item.item_type == 'SOCKET':
+            default = _value_token(item.default_value) if hasattr(item, "default_value") else None
+            tokens.append(('SOCKET', item.name, item.in_out, item.socket_type, default))
+        else:
+            tokens.append(('PANEL', item.name))
+    digest = _new_hash()
+    digest.update(repr(tokens).encode())
+    return digest.hexdigest()
+
+def tree_hash(tree, _visiting=None):
+    # Bottom-up Merkle hash: nested groups first, then nodes, links and interface of this tree
+    cached = _hash_cache.get(tree)
+    if cached is not None:
+        return cached
+
+    visiting = _visiting if _visiting is not None else set()
+    visiting.add(tree.session_uid)
+
+    nodes = {}
+    children = []
+    for node in tree.nodes:
+        group = node.node_tree if node.type == 'GROUP' else None
+        group_name = None
+        group_digest = None
+        if group and group.session_uid not in visiting:
+            group_name = group.name
+            group_digest = tree_hash(group, visiting)["digest"]
+            children.append(group)
+        nodes[node.name] = [node_digest(node, group_digest), node.bl_idname, group_name]
+
+    links = sorted(link_key(link) for link in tree.links)
+    digest = _new_hash()
+    digest.update(interface_digest(tree).encode())
+    for name in sorted(nodes):
+        digest.update(nodes[name][0].encode())
+    digest.update(repr(links).encode())
+
+    visiting.discard(tree.session_uid)
+    record = {"name": tree.name, "digest": digest.hexdigest(), "nodes": nodes, "links": [list(link) for link in links]}
+    return _hash_cache.set(tree, record, depends=children)
+
+def tree_digest(tree):
+    return tree_hash(tree)["digest"]
+
+def modifier_digest(modifier):
+    # Node group content plus the modifier's input values and attribute settings, which also drive the result
+    digest = _new_hash()
+    digest.update(tree_digest(modifier.node_group).encode())
+    inputs = sorted((key, _value_token(modifier[key])) for key in modifier.keys())
+    digest.update(repr(inputs).encode())
+    return digest.hexdigest()
+
+def tree_hash_records(tree):
+    # The tree and every group nested in it, keyed by name, in a JSON friendly form
+    records = {}
+    pending = [tree]
+    while pending:
+        current = pending.pop()
+        if current.name in records:
+            continue
+        records[current.name] = tree_hash(current)
+        for node in current.nodes:
+            if node.type == 'GROUP' and node.node_tree:
+                pending.append(node.node_tree)
+    return records
+
+def diff_tree_records(records_a, records_b, name_a, name_b, path=None, visited=None):
+    # Compare two hashed trees, only descending into group nodes whose hashes differ
+    path = path or []
+    visited = visited if visited is not None else set()
+    changes = []
+    a = records_a.get(name_a)
+    b = records_b.get(name_b)
+    if a is None or b is None or a["digest"] == b["digest"] or (name_a, name_b) in visited:
+        return changes
+    visited.add((name_a, name_b))
+
+    nodes_a = a["nodes"]
+    nodes_b = b["nodes"]
+    links_a = {tuple(link) for link in a["links"]}
+    links_b = {tuple(link) for link in b["links"]}
+    relinked = set()
+    for link in links_a ^ links_b:
+        relinked.add(link[0])
+        relinked.add(link[2])
+
+    for name in sorted(set(nodes_a) | set(nodes_b)):
+        if name not in nodes_b:
+            changes.append({"status": 'ADDED', "path": path, "node": name})
+        elif name not in nodes_a:
+            changes.append({"status": 'REMOVED', "path": path, "node": name})
+        elif nodes_a[name][0] != nodes_b[name][0] or name in relinked:
+            changes.append({"status": 'MODIFIED', "path": path, "node": name})
+            group_a = nodes_a[name][2]
+            group_b = nodes_b[name][2]
+            if group_a and group_b:
+                changes.extend(diff_tree_records(records_a, records_b, group_a, group_b, path + [name], visited))
+    return changes
+
+def load_external_records(filepath, group_name):
+    # Hash the group in another .blend file with a background Blender running our command line audit
+    command = [
+        bpy.app.binary_path, "--background", "--factory-startup", *PYTHON_EXIT_CODE, bpy.path.abspath(filepath),
+        "--python", os.path.join(os.path.dirname(os.path.abspath(__file__)), "cli.py"),
+        "--", "audit", "--worker", "--analyses", "tree_hashes",
+    ]
+    result = subprocess.run(command, capture_output=True, text=True)
+    records = {}
+    for line in result.stdout.splitlines():
+        if line.startswith(LINE_PREFIX):
+            record = json.loads(line[len(LINE_PREFIX):])
+            if "hash" in record:
+                records[record["tree"]] = record["hash"]
+    if result.returncode != 0:
+        raise RuntimeError(f"Hashing {filepath} failed with exit code {result.returncode}")
+    if group_name not in records:
+        raise RuntimeError(f"Node group '{group_name}' not found in {filepath}")
+    return records
+
+_diff_results = []
+
+class DiffRow(PropertyGroup):
+    pass
+
+class NODEHELPER_OT_diff_node_groups(Operator):
+    bl_idname = "nodehelper.diff_node_groups"
+    bl_label = "Compare Node Groups"
+    bl_description = "Compare the edited node group with another group, in this file or another .blend file, and select changed nodes"
+
+    def execute(self, context):
+        tree = context.space_data.edit_tree
+        if not tree:
+            self.report({'WARNING'}, "No active node tree")
+            return {'CANCELLED'}
+
+        scene = context.scene
+        other_name = scene.nodehelper_diff_group or tree.name
+        records_a = tree_hash_records(tree)
+        try:
+            if scene.nodehelper_diff_filepath:
+                records_b = load_external_records(scene.nodehelper_diff_filepath, other_name)
+            else:
+                other = bpy.data.node_groups.get(other_name)
+                if not other or other == tree:
+                    self.report({'ERROR'}, "Choose another node group or a .blend file to compare with")
+                    return {'CANCELLED'}
+                records_b = tree_hash_records(other)
+        except Exception as e:
+            self.report({'ERROR'}, f"Failed to hash comparison group: {str(e)}")
+            return {'CANCELLED'}
+
+        _diff_results.clear()
+        _diff_results.extend(diff_tree_records(records_a, records_b, tree.name, other_name))
+        sync_proxy_rows(context.window_manager.nodehelper_diff_rows, len(_diff_results))
+
+        # Highlight changes in the edited tree by selecting them
+        changed = {change["node"] for change in _diff_results if not change["path"] and change["status"] != 'REMOVED'}
+        for node in tree.nodes:
+            node.select = node.name in changed
+
+        self.report({'INFO'}, f"Found {len(_diff_results)} difference(s)" if _diff_results else "Node groups are identical")
+        return {'FINISHED'}
+
+class NODEHELPER_OT_jump_to_difference(Operator):
+    bl_idname = "nodehelper.jump_to_difference"
+    bl_label = "Jump to Difference"
+
+    index: IntProperty()
+
+    def execute(self, context):
+        if not 0 <= self.index < len(_diff_results):
+            self.report({'ERROR'}, "Comparison is out of date, compare again.")
+            return {'CANCELLED'}
+        change = _diff_results[self.index]
+        root_tree = context.space_data.edit_tree
+        node_name = change["node"] if change["status"] != 'REMOVED' else None
+        _, error = open_node_path(context, change["path"], node_name, root_tree=root_tree)
+        if error:
+            self.report({'ERROR'}, error)
+            return {'CANCELLED'}
+        return {'FINISHED'}
+
+class NODEHELPER_UL_diff(UIList):
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        if index >= len(_diff_results):
+            return
+        change = _diff_results[index]
+        icons = {'ADDED': 'ADD', 'REMOVED': 'REMOVE', 'MODIFIED': 'GREASEPENCIL'}
+        op = layout.operator("nodehelper.jump_to_difference", text=' > '.join(change["path"] + [change["node"]]), icon=icons[change["status"]])
+        op.index = index
+
+class NODEHELPER_PT_diff(Panel):
+    bl_label = "Compare"
+    bl_idname = "NODEHELPER_PT_diff"
+    bl_space_type = 'NODE_EDITOR'
+    bl_region_type = 'UI'
+    bl_category = "NodeHelper"
+
+    @classmethod
+    def poll(cls, context):
+        return context.space_data.type == 'NODE_EDITOR' and context.space_data.tree_type == 'GeometryNodeTree'
+
+    def draw(self, context):
+        layout = self.layout
+        scene = context.scene
+
+        box = layout.box()
+        box.prop_search(scene, "nodehelper_diff_group", bpy.data, "node_groups", text="Group")
+        box.prop(scene, "nodehelper_diff_filepath", text="File")
+        row = box.row()
+        row.scale_y = 1.5
+        row.operator("nodehelper.diff_node_groups", text="Compare", icon='ARROW_LEFTRIGHT')
+
+        if _diff_results:
+            wm = context.window_manager
+            box.template_list("NODEHELPER_UL_diff", "", wm, "nodehelper_diff_rows", wm, "nodehelper_active_diff_index", rows=5)
+
+def register():
+    bpy.utils.register_class(DiffRow)
+    bpy.utils.register_class(NODEHELPER_OT_diff_node_groups)
+    bpy.utils.register_class(NODEHELPER_OT_jump_to_difference)
+    bpy.utils.register_class(NODEHELPER_UL_diff)
+    bpy.utils.register_class(NODEHELPER_PT_diff)
+    bpy.types.WindowManager.nodehelper_diff_rows = CollectionProperty(type=DiffRow)
+    bpy.types.WindowManager.nodehelper_active_diff_index = IntProperty()
+    bpy.types.Scene.nodehelper_diff_group = StringProperty(
+        name="Compare Group",
+        description="Node group to compare the edited group with (defaults to the edited group's name when a file is set)",
+        default=""
+    )
+    bpy.types.Scene.nodehelper_diff_filepath = StringProperty(
+        name="Compare File",
+        description="Optional .blend file containing the group to compare with",
+        default="",
+        subtype='FILE_PATH'
+    )
+
+def unregister():
+    del bpy.types.Scene.nodehelper_diff_filepath
+    del bpy.types.Scene.nodehelper_diff_group
+    _diff_results.clear()
+    _hash_cache.clear()
+    del bpy.types.WindowManager.nodehelper_active_diff_index
+    del bpy.types.WindowManager.nodehelper_diff_rows
+    bpy.utils.unregister_class(NODEHELPER_PT_diff)
+    bpy.utils.unregister_class(NODEHELPER_UL_diff)
+    bpy.utils.unregister_class(NODEHELPER_OT_jump_to_difference)
+    bpy.utils.unregister_class(NODEHELPER_OT_diff_node_groups)
+    bpy.utils.unregister_class(DiffRow)
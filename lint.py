@@ -0,0 +1,289 @@
+import bpy
+import numpy as np
+from fnmatch import fnmatchcase
+from bpy.types import Operator, Panel, PropertyGroup, UIList
+from bpy.props import IntProperty, CollectionProperty
+from .node_utils import jump_to_tree_node
+from .snapshot import TreeSnapshot
+
+# Registered rules: (code, description, function). A rule is called with (tree, info) and yields (node, message).
+LINT_RULES = []
+
+def lint_rule(code, description):
+    def decorator(function):
+        register_lint_rule(code, description, function)
+        return function
+    return decorator
+
+def register_lint_rule(code, description, function):
+    unregister_lint_rule(code)
+    LINT_RULES.append((code, description, function))
+
+def unregister_lint_rule(code):
+    LINT_RULES[:] = [rule for rule in LINT_RULES if rule[0] != code]
+
+ZONE_INPUT_NODES = {
+    'GeometryNodeRepeatInput': "Repeat",
+    'GeometryNodeSimulationInput': "Simulation",
+    'GeometryNodeForeachGeometryElementInput': "For Each Element",
+}
+
+EXPENSIVE_ZONE_NODES = {
+    'GeometryNodeSampleNearest',
+    'GeometryNodeSampleNearestSurface',
+    'GeometryNodeRaycast',
+    'GeometryNodeMeshBoolean',
+    'GeometryNodeProximity',
+}
+
+# Operations that also work on instances and are far cheaper there than on realized geometry
+INSTANCE_CAPABLE_NODES = {
+    'GeometryNodeTransform',
+    'GeometryNodeTranslateInstances',
+    'GeometryNodeRotateInstances',
+    'GeometryNodeScaleInstances',
+    'GeometryNodeSetMaterial',
+    'GeometryNodeSetInstanceTransform',
+}
+
+# Built-in attributes that have a dedicated input node
+BUILTIN_ATTRIBUTE_NODES = {
+    'position': "Position",
+    'id': "ID",
+    'radius': "Radius",
+    'material_index': "Material Index",
+    'sharp_face': "Is Face Smooth",
+    'sharp_edge': "Is Edge Smooth",
+    'resolution': "Spline Resolution",
+    'cyclic': "Is Spline Cyclic",
+    'tilt': "Curve Tilt",
+    'handle_left': "Curve Handle Positions",
+    'handle_right': "Curve Handle Positions",
+}
+
+CAPTURE_NODES = {'GeometryNodeCaptureAttribute', 'GeometryNodeStoreNamedAttribute'}
+
+class TreeLintInfo:
+    # Per-tree data shared by all rules: a topology snapshot and zone membership
+    def __init__(self, tree):
+        self.tree = tree
+        self.snapshot = TreeSnapshot(tree)
+        nodes = self.snapshot.nodes
+        index = {node.name: i for i, node in enumerate(nodes)}
+
+        self.zones = {}
+        for i, node in enumerate(nodes):
+            kind = ZONE_INPUT_NODES.get(self.snapshot.node_idnames[i])
+            output = getattr(node, "paired_output", None)
+            if not kind or not output or output.name not in index:
+                continue
+            output_index = index[output.name]
+            inside = self.snapshot.reachable([i]) & self.snapshot.reachable([output_index], forward=False)
+            inside[[i, output_index]] = False
+            for j in np.flatnonzero(inside):
+                self.zones.setdefault(nodes[j].name, kind)
+
+def follow_links(socket):
+    # Target sockets of an output, looking through reroutes
+    targets = []
+    for link in socket.links:
+        if link.is_muted:
+            continue
+        if link.to_node.bl_idname == 'NodeReroute':
+            targets.extend(follow_links(link.to_node.outputs[0]))
+        else:
+            targets.append(link.to_socket)
+    return targets
+
+def source_socket(socket):
+    # Output feeding an input, looking through reroutes
+    while socket.links:
+        from_socket = socket.links[0].from_socket
+        if from_socket.node.bl_idname != 'NodeReroute':
+            return from_socket
+        socket = from_socket.node.inputs[0]
+    return None
+
+def unlinked_string(node, name, index=None):
+    socket = node.inputs.get(name) if index is None else node.inputs[index]
+    if socket is None or socket.is_linked:
+        return None
+    return socket.default_value
+
+@lint_rule('REALIZE_EARLY', "Realize Instances followed by an operation that also works on instances")
+def lint_realize_early(tree, info):
+    for node in tree.nodes:
+        if node.bl_idname != 'GeometryNodeRealizeInstances' or node.mute:
+            continue
+        for socket in follow_links(node.outputs[0]):
+            if socket.node.bl_idname in INSTANCE_CAPABLE_NODES:
+                yield node, f"Realized before '{socket.node.name}', apply it to the instances first"
+                break
+
+@lint_rule('EXPENSIVE_IN_ZONE', "Expensive sampling or boolean nodes inside Repeat or Simulation zones")
+def lint_expensive_in_zone(tree, info):
+    for node in tree.nodes:
+        if node.bl_idname in EXPENSIVE_ZONE_NODES and node.name in info.zones:
+            yield node, f"{node.bl_label} runs every {info.zones[node.name]} zone iteration"
+
+@lint_rule('DUPLICATE_CAPTURE', "The same field is captured or stored more than once")
+def lint_duplicate_capture(tree, info):
+    seen = {}
+    for node in tree.nodes:
+        if node.bl_idname not in CAPTURE_NODES or node.mute:
+            continue
+        for socket in node.inputs[1:]:
+            if not socket.enabled or socket.type == 'GEOMETRY' or socket.name in {"Name", "Selection"}:
+                continue
+            source = source_socket(socket)
+            if source is None:
+                continue
+            # Same field on another geometry (e.g. before and after a Transform) or domain is a different capture
+            geometry = source_socket(node.inputs[0])
+            geometry_key = (geometry.node.name, geometry.identifier) if geometry else None
+            key = (source.node.name, source.identifier, geometry_key, getattr(node, "domain", None))
+            if key in seen and seen[key] != node.name:
+                yield node, f"'{source.node.name}' is already captured by '{seen[key]}'"
+                break
+            seen.setdefault(key, node.name)
+
+@lint_rule('BUILTIN_NAMED_ATTRIBUTE', "Named Attribute reads a built-in attribute that has its own input node")
+def lint_builtin_named_attribute(tree, info):
+    for node in tree.nodes:
+        if node.bl_idname != 'GeometryNodeInputNamedAttribute':
+            continue
+        name = unlinked_string(node, "Name", 0)
+        if name in BUILTIN_ATTRIBUTE_NODES:
+            yield node, f"Use the {BUILTIN_ATTRIBUTE_NODES[name]} node instead of reading '{name}'"
+
+@lint_rule('STORE_THEN_REMOVE', "Store Named Attribute whose result is removed right away")
+def lint_store_then_remove(tree, info):
+    for node in tree.nodes:
+        if node.bl_idname != 'GeometryNodeStoreNamedAttribute' or node.mute:
+            continue
+        stored_name = unlinked_string(node, "Name")
+        if not stored_name:
+            continue
+        for socket in follow_links(node.outputs[0]):
+            remove = socket.node
+            if remove.bl_idname != 'GeometryNodeRemoveNamedAttribute' or remove.mute:
+                continue
+            pattern = unlinked_string(remove, "Name", 1)
+            if pattern and (pattern == stored_name or getattr(remove, "pattern_mode", 'EXACT') == 'WILDCARD' and fnmatchcase(stored_name, pattern)):
+                yield node, f"'{stored_name}' is removed by '{remove.name}' right after being stored"
+                break
+
+def lint_tree(tree, rules=None):
+    info = TreeLintInfo(tree)
+    for code, description, function in (rules if rules is not None else LINT_RULES):
+        for node, message in function(tree, info):
+            yield code, node, message
+
+_lint_results = []
+
+class LintIssueRow(PropertyGroup):
+    pass
+
+def sync_lint_rows(context):
+    # The UIList needs an RNA collection; the proxy rows carry no data, only their count matters
+    rows = context.window_manager.nodehelper_lint_rows
+    while len(rows) > len(_lint_results):
+        rows.remove(len(rows) - 1)
+    for _ in range(len(_lint_results) - len(rows)):
+        rows.add()
+
+class NODEHELPER_OT_lint_node_groups(Operator):
+    bl_idname = "nodehelper.lint_node_groups"
+    bl_label = "Lint Node Groups"
+    bl_description = "Check every geometry node group for known performance pitfalls"
+
+    def execute(self, context):
+        _lint_results.clear()
+        # Every group is checked once, however often it is instanced
+        for tree in bpy.data.node_groups:
+            if tree.bl_idname != 'GeometryNodeTree':
+                continue
+            for code, node, message in lint_tree(tree):
+                _lint_results.append({'rule': code, 'group': tree.name, 'node': node.name, 'message': message})
+        sync_lint_rows(context)
+
+        self.report({'INFO'}, f"Found {len(_lint_results)} issue(s)")
+        return {'FINISHED'}
+
+class NODEHELPER_OT_jump_to_lint_issue(Operator):
+    bl_idname = "nodehelper.jump_to_lint_issue"
+    bl_label = "Jump to Issue"
+
+    index: IntProperty()
+
+    @classmethod
+    def description(cls, context, properties):
+        if 0 <= properties.index < len(_lint_results):
+            return _lint_results[properties.index]['message']
+        return "Jump to the node"
+
+    def execute(self, context):
+        if not 0 <= self.index < len(_lint_results):
+            self.report({'ERROR'}, "Lint results are out of date, run the check again.")
+            return {'CANCELLED'}
+        issue = _lint_results[self.index]
+        tree = bpy.data.node_groups.get(issue['group'])
+        if not tree:
+            self.report({'ERROR'}, f"Node group '{issue['group']}' not found.")
+            return {'CANCELLED'}
+        error = jump_to_tree_node(context, tree, issue['node'])
+        if error:
+            self.report({'ERROR'}, error)
+            return {'CANCELLED'}
+        self.report({'INFO'}, issue['message'])
+        return {'FINISHED'}
+
+class NODEHELPER_UL_lint_issues(UIList):
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        if index >= len(_lint_results):
+            return
+        issue = _lint_results[index]
+        op = layout.operator("nodehelper.jump_to_lint_issue", text=f"{issue['group']} > {issue['node']} ({issue['rule']})", icon='NODE')
+        op.index = index
+
+class NODEHELPER_PT_lint(Panel):
+    bl_label = "Performance Lint"
+    bl_idname = "NODEHELPER_PT_lint"
+    bl_space_type = 'NODE_EDITOR'
+    bl_region_type = 'UI'
+    bl_category = "NodeHelper"
+
+    @classmethod
+    def poll(cls, context):
+        return context.space_data.type == 'NODE_EDITOR' and context.space_data.tree_type == 'GeometryNodeTree'
+
+    def draw(self, context):
+        layout = self.layout
+
+        box = layout.box()
+        row = box.row()
+        row.scale_y = 1.5
+        row.operator("nodehelper.lint_node_groups", text="Check Node Groups", icon='ERROR')
+
+        if _lint_results:
+            wm = context.window_manager
+            box.template_list("NODEHELPER_UL_lint_issues", "", wm, "nodehelper_lint_rows", wm, "nodehelper_active_lint_index", rows=5)
+
+def register():
+    bpy.utils.register_class(LintIssueRow)
+    bpy.utils.register_class(NODEHELPER_OT_lint_node_groups)
+    bpy.utils.register_class(NODEHELPER_OT_jump_to_lint_issue)
+    bpy.utils.register_class(NODEHELPER_UL_lint_issues)
+    bpy.utils.register_class(NODEHELPER_PT_lint)
+    bpy.types.WindowManager.nodehelper_lint_rows = CollectionProperty(type=LintIssueRow)
+    bpy.types.WindowManager.nodehelper_active_lint_index = IntProperty()
+
+def unregister():
+    _lint_results.clear()
+    del bpy.types.WindowManager.nodehelper_active_lint_index
+    del bpy.types.WindowManager.nodehelper_lint_rows
+    bpy.utils.unregister_class(NODEHELPER_PT_lint)
+    bpy.utils.unregister_class(NODEHELPER_UL_lint_issues)
+    bpy.utils.unregister_class(NODEHELPER_OT_jump_to_lint_issue)
+    bpy.utils.unregister_class(NODEHELPER_OT_lint_node_groups)
+    bpy.utils.unregister_class(LintIssueRow)
@@ -63,6 +63,70 @@ def replace_node_with_type(node_tree, old_node, new_type):
     return new_node
 
 
+def find_group_node_path(root_tree, target_tree):
+    # Breadth-first search for the chain of group node names leading from root_tree into target_tree
+    if root_tree == target_tree:
+        return []
+    visited = {root_tree}
+    queue = [(root_tree, [])]
+    while queue:
+        tree, path = queue.pop(0)
+        for node in tree.nodes:
+            group = node.node_tree if node.type == 'GROUP' else None
+            if not group or group in visited:
+                continue
+            if group == target_tree:
+                return path + [node.name]
+            visited.add(group)
+            queue.append((group, path + [node.name]))
+    return None
+
+def open_node_path(context, group_node_names, target_node_name=None, root_tree=None):
+    # Enter the nested groups named by group_node_names and frame target_node_name in the last one
+    space = context.space_data
+    if root_tree is not None and root_tree != space.node_tree:
+        space.pin = True
+        space.node_tree = root_tree
+    current_tree = space.node_tree
+    space.path.clear()
+    space.path.start(current_tree)
+
+    for group_node_name in group_node_names:
+        group_node = current_tree.nodes.get(group_node_name)
+        if not group_node or group_node.type != 'GROUP' or not group_node.node_tree:
+            return None, f"Node '{group_node_name}' is not a valid group."
+        space.path.append(group_node.node_tree, node=group_node)
+        current_tree = group_node.node_tree
+
+    target_node = current_tree.nodes.get(target_node_name) if target_node_name else None
+    if target_node_name and not target_node:
+        return None, f"Node '{target_node_name}' not found."
+
+    if target_node:
+        for node in current_tree.nodes:
+            node.select = False
+        target_node.select = True
+        current_tree.nodes.active = target_node
+        bpy.ops.node.view_selected('INVOKE_DEFAULT')
+    return current_tree, None
+
+def jump_to_tree_node(context, target_tree, node_name=None):
+    # Enter target_tree from the current tree if it is nested in it, otherwise pin the editor to it
+    root_tree = context.space_data.node_tree
+    group_path = find_group_node_path(root_tree, target_tree) if root_tree else None
+    if group_path is None:
+        root_tree = target_tree
+        group_path = []
+    _, error = open_node_path(context, group_path, node_name, root_tree=root_tree)
+    return error
+
+def sync_proxy_rows(rows, count):
+    # Result lists live in Python; a UIList needs an RNA collection, so it gets empty proxy rows, only their count matters
+    while len(rows) > count:
+        rows.remove(len(rows) - 1)
+    for _ in range(count - len(rows)):
+        rows.add()
+
 class NODEHELPER_OT_replace_with_selected(bpy.types.Operator):
     bl_idname = "nodehelper.replace_with_selected"
     bl_label = "Replace With Selected"
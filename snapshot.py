@@ -0,0 +1,105 @@
+import numpy as np
+
+class TreeSnapshot:
+    # Flat arrays of a tree's nodes, sockets and links, pulled from RNA in one pass.
+    # Nodes, sockets and links are addressed by their index; the RNA objects are only
+    # looked up again (self.nodes, self.sockets) when results are mapped back.
+    # A snapshot must not outlive the operator that built it, the tree may change afterwards.
+    def __init__(self, tree):
+        self.tree = tree
+        self.nodes = list(tree.nodes)
+        node_count = len(self.nodes)
+
+        self.node_mute = np.zeros(node_count, dtype=bool)
+        tree.nodes.foreach_get("mute", self.node_mute)
+        self.node_types = [node.type for node in self.nodes]
+        self.node_idnames = [node.bl_idname for node in self.nodes]
+
+        # Sockets of all nodes, inputs and outputs, keyed by their pointer
+        self.sockets = []
+        socket_node = []
+        socket_is_output = []
+        for node_index, node in enumerate(self.nodes):
+            for socket in node.inputs:
+                self.sockets.append(socket)
+                socket_node.append(node_index)
+                socket_is_output.append(False)
+            for socket in node.outputs:
+                self.sockets.append(socket)
+                socket_node.append(node_index)
+                socket_is_output.append(True)
+        self.socket_node = np.array(socket_node, dtype=np.int32)
+        self.socket_is_output = np.array(socket_is_output, dtype=bool)
+        self.socket_names = [socket.name for socket in self.sockets]
+        self.socket_pointers = np.fromiter((socket.as_pointer() for socket in self.sockets), dtype=np.uint64, count=len(self.sockets))
+
+        link_count = len(tree.links)
+        self.link_muted = np.zeros(link_count, dtype=bool)
+        self.link_valid = np.zeros(link_count, dtype=bool)
+        if link_count:
+            tree.links.foreach_get("is_muted", self.link_muted)
+            tree.links.foreach_get("is_valid", self.link_valid)
+        link_pointers = np.fromiter(
+            (pointer for link in tree.links for pointer in (link.from_socket.as_pointer(), link.to_socket.as_pointer())),
+            dtype=np.uint64, count=link_count * 2,
+        ).reshape(link_count, 2)
+
+        # Map link endpoints to socket indices with one sorted lookup
+        order = np.argsort(self.socket_pointers)
+        sorted_pointers = self.socket_pointers[order]
+        self.link_from_socket = order[np.searchsorted(sorted_pointers, link_pointers[:, 0])] if link_count else np.zeros(0, dtype=np.intp)
+        self.link_to_socket = order[np.searchsorted(sorted_pointers, link_pointers[:, 1])] if link_count else np.zeros(0, dtype=np.intp)
+        self.link_from_node = self.socket_node[self.link_from_socket]
+        self.link_to_node = self.socket_node[self.link_to_socket]
+
+    @property
+    def node_count(self):
+        return len(self.nodes)
+
+    def node_indices(self, node_type):
+        return np.array([i for i, value in enumerate(self.node_types) if value == node_type], dtype=np.intp)
+
+    def socket_link_counts(self, include_muted=True):
+        # Number of links attached to each socket, from either end
+        mask = np.ones(len(self.link_muted), dtype=bool) if include_muted else ~self.link_muted
+        return (np.bincount(self.link_from_socket[mask], minlength=len(self.sockets))
+                + np.bincount(self.link_to_socket[mask], minlength=len(self.sockets)))
+
+    def degrees(self, include_muted=True):
+        mask = np.ones(len(self.link_muted), dtype=bool) if include_muted else ~self.link_muted
+        in_degree = np.bincount(self.link_to_node[mask], minlength=self.node_count)
+        out_degree = np.bincount(self.link_from_node[mask], minlength=self.node_count)
+        return in_degree, out_degree
+
+    def adjacency(self, forward=True, include_muted=False):
+        # Compressed sparse rows: neighbours of node i are targets[offsets[i]:offsets[i + 1]]
+        mask = self.link_valid if include_muted else self.link_valid & ~self.link_muted
+        sources = (self.link_from_node if forward else self.link_to_node)[mask]
+        targets = (self.link_to_node if forward else self.link_from_node)[mask]
+        order = np.argsort(sources, kind='stable')
+        offsets = np.searchsorted(sources[order], np.arange(self.node_count + 1))
+        return offsets, targets[order]
+
+    def reachable(self, start_nodes, forward=True, include_muted=False):
+        # Nodes reachable from start_nodes (not including them unless on a cycle), one vectorized step per depth
+        offsets, targets = self.adjacency(forward, include_muted)
+        visited = np.zeros(self.node_count, dtype=bool)
+        frontier = np.unique(np.asarray(start_nodes, dtype=np.intp))
+        while frontier.size:
+            starts = offsets[frontier]
+            counts = offsets[frontier + 1] - starts
+            total = int(counts.sum())
+            if not total:
+                break
+            shifts = np.repeat(starts - np.concatenate(([0], np.cumsum(counts)[:-1])), counts)
+            neighbours = targets[shifts + np.arange(total)]
+            frontier = np.unique(neighbours[~visited[neighbours]])
+            visited[frontier] = True
+        return visited
+
+    def group_input_output_mask(self, name=None):
+        # Output sockets of Group Input nodes, optionally only those with the given name
+        mask = self.socket_is_output & np.isin(self.socket_node, self.node_indices('GROUP_INPUT'))
+        if name is not None:
+            mask &= np.array([socket_name == name for socket_name in self.socket_names], dtype=bool)
+        return mask
@@ -0,0 +1,94 @@
+import bpy
+from bpy.app.handlers import persistent
+
+# Every cache created by the addon, invalidated together from the handlers below
+_caches = []
+_change_listeners = []
+
+class TreeCache:
+    # Values are keyed by ID session_uid, which stays stable across renames and is shared with evaluated copies
+    def __init__(self):
+        self._values = {}
+        self._dependents = {}
+        _caches.append(self)
+
+    def get(self, id_data, default=None):
+        return self._values.get(id_data.session_uid, default)
+
+    def set(self, id_data, value, depends=()):
+        key = id_data.session_uid
+        self._values[key] = value
+        for dependency in depends:
+            self._dependents.setdefault(dependency.session_uid, set()).add(key)
+        return value
+
+    def __contains__(self, id_data):
+        return id_data.session_uid in self._values
+
+    def invalidate(self, keys):
+        # Drop the given keys and, transitively, everything that was built from them
+        removed = set()
+        pending = list(keys)
+        while pending:
+            key = pending.pop()
+            if key in removed:
+                continue
+            removed.add(key)
+            self._values.pop(key, None)
+            pending.extend(self._dependents.pop(key, ()))
+        return removed
+
+    def clear(self):
+        self._values.clear()
+        self._dependents.clear()
+
+def add_change_listener(callback):
+    # callback(changed) receives a set of session_uids, or None when everything must be considered changed
+    if callback not in _change_listeners:
+        _change_listeners.append(callback)
+
+def remove_change_listener(callback):
+    if callback in _change_listeners:
+        _change_listeners.remove(callback)
+
+def _notify(changed):
+    for cache in _caches:
+        if changed is None:
+            cache.clear()
+        else:
+            cache.invalidate(changed)
+    for callback in _change_listeners:
+        callback(changed)
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph=None):
+    if depsgraph is None:
+        return
+    changed = set()
+    for update in depsgraph.updates:
+        id_data = update.id
+        if isinstance(id_data, (bpy.types.NodeTree, bpy.types.Object)):
+            changed.add(id_data.session_uid)
+    # Node groups not used by any object are not in the view layer depsgraph, so edits to them
+    # never show up in updates; the type flag is all we get, treat only those groups as changed
+    if depsgraph.id_type_updated('NODETREE'):
+        evaluated = {id_data.session_uid for id_data in depsgraph.ids if isinstance(id_data, bpy.types.NodeTree)}
+        changed.update(tree.session_uid for tree in bpy.data.node_groups if tree.session_uid not in evaluated)
+    if changed:
+        _notify(changed)
+
+@persistent
+def _on_load_post(*args):
+    _notify(None)
+
+def invalidate_all():
+    _notify(None)
+
+def register():
+    bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    bpy.app.handlers.load_post.append(_on_load_post)
+
+def unregister():
+    bpy.app.handlers.load_post.remove(_on_load_post)
+    bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    _notify(None)
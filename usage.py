@@ -0,0 +1,242 @@
+import bpy
+from bpy.types import Operator, Panel, PropertyGroup, UIList
+from bpy.props import IntProperty, CollectionProperty
+from .node_utils import jump_to_tree_node, sync_proxy_rows
+from . import tree_cache
+
+class GroupUsageIndex:
+    # Reverse index: node group -> group nodes, Nodes modifiers and objects that instance it
+    def __init__(self):
+        self.trees = {}
+        self.group_users = {}
+        self.modifier_users = {}
+        self._ancestors = {}
+        self._instance_counts = {}
+        self._depths = {}
+
+        for tree in bpy.data.node_groups:
+            self.trees[tree.session_uid] = tree
+            for node in tree.nodes:
+                if node.type == 'GROUP' and node.node_tree:
+                    self.group_users.setdefault(node.node_tree.session_uid, []).append((tree.session_uid, node.name))
+
+        for obj in bpy.data.objects:
+            for modifier in obj.modifiers:
+                if modifier.type == 'NODES' and modifier.node_group:
+                    self.modifier_users.setdefault(modifier.node_group.session_uid, []).append((obj.name, modifier.name))
+
+    def direct_users(self, tree):
+        uid = tree.session_uid
+        return self.group_users.get(uid, []), self.modifier_users.get(uid, [])
+
+    def ancestors(self, uid, _visiting=None):
+        # Transitive closure of parent groups, memoized per group
+        if uid in self._ancestors:
+            return self._ancestors[uid]
+        visiting = _visiting if _visiting is not None else set()
+        if uid in visiting:
+            return frozenset()
+        visiting.add(uid)
+        result = set()
+        for parent_uid, _ in self.group_users.get(uid, ()):
+            result.add(parent_uid)
+            result |= self.ancestors(parent_uid, visiting)
+        visiting.discard(uid)
+        self._ancestors[uid] = frozenset(result)
+        return self._ancestors[uid]
+
+    def instance_count(self, uid, _visiting=None):
+        # How many times the group is evaluated through all modifiers, counting every nesting path
+        if uid in self._instance_counts:
+            return self._instance_counts[uid]
+        visiting = _visiting if _visiting is not None else set()
+        if uid in visiting:
+            return 0
+        visiting.add(uid)
+        count = len(self.modifier_users.get(uid, ()))
+        for parent_uid, _ in self.group_users.get(uid, ()):
+            count += self.instance_count(parent_uid, visiting)
+        visiting.discard(uid)
+        self._instance_counts[uid] = count
+        return count
+
+    def max_depth(self, uid, _visiting=None):
+        # Deepest nesting level below a modifier, 0 for groups used directly by a modifier
+        if uid in self._depths:
+            return self._depths[uid]
+        visiting = _visiting if _visiting is not None else set()
+        if uid in visiting:
+            return -1
+        visiting.add(uid)
+        depth = 0 if uid in self.modifier_users else -1
+        for parent_uid, _ in self.group_users.get(uid, ()):
+            parent_depth = self.max_depth(parent_uid, visiting)
+            if parent_depth >= 0:
+                depth = max(depth, parent_depth + 1)
+        visiting.discard(uid)
+        self._depths[uid] = depth
+        return depth
+
+_usage_index = None
+_usage_results = []
+_usage_summary = [""]
+
+class UsageRow(PropertyGroup):
+    pass
+
+def get_usage_index():
+    global _usage_index
+    if _usage_index is None:
+        _usage_index = GroupUsageIndex()
+    return _usage_index
+
+def _on_data_changed(changed):
+    global _usage_index
+    _usage_index = None
+
+def collect_usages(index, tree):
+    results = []
+    group_users, modifier_users = index.direct_users(tree)
+    for parent_uid, node_name in group_users:
+        parent = index.trees[parent_uid]
+        results.append({
+            'kind': 'GROUP',
+            'parent': parent.name,
+            'node_name': node_name,
+            'instances': index.instance_count(parent_uid),
+        })
+    for object_name, modifier_name in modifier_users:
+        results.append({
+            'kind': 'MODIFIER',
+            'parent': object_name,
+            'node_name': modifier_name,
+            'instances': 1,
+        })
+    results.sort(key=lambda item: (item['kind'], item['parent'].lower(), item['node_name'].lower()))
+    return results
+
+class NODEHELPER_OT_find_group_usages(Operator):
+    bl_idname = "nodehelper.find_group_usages"
+    bl_label = "Find Group Usages"
+    bl_description = "List the node groups, modifiers and objects that use the current node group"
+
+    def execute(self, context):
+        tree = context.space_data.edit_tree
+        if not tree:
+            self.report({'WARNING'}, "No active node tree")
+            return {'CANCELLED'}
+
+        index = get_usage_index()
+        _usage_results.clear()
+        _usage_results.extend(collect_usages(index, tree))
+        sync_proxy_rows(context.window_manager.nodehelper_usage_rows, len(_usage_results))
+
+        uid = tree.session_uid
+        _usage_summary[0] = (
+            f"{tree.name}: {len(index.ancestors(uid))} parent group(s), "
+            f"{index.instance_count(uid)} instance(s), depth {max(index.max_depth(uid), 0)}"
+        )
+        self.report({'INFO'}, f"Found {len(_usage_results)} direct usage(s) of '{tree.name}'")
+        return {'FINISHED'}
+
+class NODEHELPER_OT_jump_to_usage(Operator):
+    bl_idname = "nodehelper.jump_to_usage"
+    bl_label = "Jump to Usage"
+    bl_description = "Show the group node or modifier using this node group"
+
+    index: IntProperty()
+
+    def execute(self, context):
+        if not 0 <= self.index < len(_usage_results):
+            self.report({'ERROR'}, "Usage list is out of date, search again.")
+            return {'CANCELLED'}
+        usage = _usage_results[self.index]
+
+        if usage['kind'] == 'MODIFIER':
+            obj = bpy.data.objects.get(usage['parent'])
+            modifier = obj.modifiers.get(usage['node_name']) if obj else None
+            if not modifier:
+                self.report({'ERROR'}, f"Modifier '{usage['node_name']}' not found.")
+                return {'CANCELLED'}
+            for other in context.view_layer.objects:
+                other.select_set(False)
+            if obj.name in context.view_layer.objects:
+                obj.select_set(True)
+                context.view_layer.objects.active = obj
+            modifier.is_active = True
+            context.space_data.pin = False
+            self.report({'INFO'}, f"Activated modifier '{modifier.name}' on '{obj.name}'")
+            return {'FINISHED'}
+
+        parent = bpy.data.node_groups.get(usage['parent'])
+        if not parent:
+            self.report({'ERROR'}, f"Node group '{usage['parent']}' not found.")
+            return {'CANCELLED'}
+
+        error = jump_to_tree_node(context, parent, usage['node_name'])
+        if error:
+            self.report({'ERROR'}, error)
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Jumped to node: {usage['node_name']}")
+        return {'FINISHED'}
+
+class NODEHELPER_UL_group_usages(UIList):
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        if index >= len(_usage_results):
+            return
+        usage = _usage_results[index]
+        row = layout.row(align=True)
+        icon = 'MODIFIER' if usage['kind'] == 'MODIFIER' else 'NODETREE'
+        op = row.operator("nodehelper.jump_to_usage", text=f"{usage['parent']} > {usage['node_name']}", icon=icon)
+        op.index = index
+        row.label(text=f"x{usage['instances']}")
+
+class NODEHELPER_PT_group_usage(Panel):
+    bl_label = "Group Usage"
+    bl_idname = "NODEHELPER_PT_group_usage"
+    bl_space_type = 'NODE_EDITOR'
+    bl_region_type = 'UI'
+    bl_category = "NodeHelper"
+
+    @classmethod
+    def poll(cls, context):
+        return context.space_data.type == 'NODE_EDITOR' and context.space_data.tree_type == 'GeometryNodeTree'
+
+    def draw(self, context):
+        layout = self.layout
+
+        box = layout.box()
+        row = box.row()
+        row.scale_y = 1.5
+        row.operator("nodehelper.find_group_usages", text="Where Is This Group Used?", icon='VIEWZOOM')
+
+        if _usage_summary[0]:
+            box.label(text=_usage_summary[0])
+
+        if _usage_results:
+            wm = context.window_manager
+            box.template_list("NODEHELPER_UL_group_usages", "", wm, "nodehelper_usage_rows", wm, "nodehelper_active_usage_index", rows=5)
+
+def register():
+    bpy.utils.register_class(UsageRow)
+    bpy.utils.register_class(NODEHELPER_OT_find_group_usages)
+    bpy.utils.register_class(NODEHELPER_OT_jump_to_usage)
+    bpy.utils.register_class(NODEHELPER_UL_group_usages)
+    bpy.utils.register_class(NODEHELPER_PT_group_usage)
+    bpy.types.WindowManager.nodehelper_usage_rows = CollectionProperty(type=UsageRow)
+    bpy.types.WindowManager.nodehelper_active_usage_index = IntProperty()
+    tree_cache.add_change_listener(_on_data_changed)
+
+def unregister():
+    global _usage_index
+    tree_cache.remove_change_listener(_on_data_changed)
+    _usage_index = None
+    _usage_results.clear()
+    _usage_summary[0] = ""
+    del bpy.types.WindowManager.nodehelper_active_usage_index
+    del bpy.types.WindowManager.nodehelper_usage_rows
+    bpy.utils.unregister_class(NODEHELPER_PT_group_usage)
+    bpy.utils.unregister_class(NODEHELPER_UL_group_usages)
+    bpy.utils.unregister_class(NODEHELPER_OT_jump_to_usage)
+    bpy.utils.unregister_class(NODEHELPER_OT_find_group_usages)
+    bpy.utils.unregister_class(UsageRow)